@@ -13,12 +13,13 @@ from src.models import Clinic
 async def seed_database() -> None:
     """Seed database with initial test data."""
     async with async_session() as session:
-        # Check if clinic already exists
-        result = await session.execute(select(Clinic).where(Clinic.name == "Test Clinic"))
-        existing_clinic = result.scalar_one_or_none()
+        # Check if clinic already exists; only its API key is reported
+        existing_api_key = await session.scalar(
+            select(Clinic.api_key).where(Clinic.name == "Test Clinic").limit(1)
+        )
 
-        if existing_clinic:
-            print(f"Clinic already exists: {existing_clinic.name} (API Key: {existing_clinic.api_key})")
+        if existing_api_key is not None:
+            print(f"Clinic already exists: Test Clinic (API Key: {existing_api_key})")
             return
 
         # Create test clinic
@@ -40,7 +41,8 @@ async def seed_database() -> None:
 
         session.add(clinic)
         await session.commit()
-        await session.refresh(clinic)
+        # No refresh: the session keeps attributes after commit, and the id
+        # printed below is generated on the Python side.
 
         print(f"✅ Created test clinic:")
         print(f"   Name: {clinic.name}")
@@ -37,6 +37,12 @@ PROHIBITED_PATTERNS = [
     (r'\b(only clinic|only dentist|unique) (in|on) (area|region|city)\b', 'MISLEADING'),
 ]
 
+# Compiled once at import; the filter runs on every agent response
+_COMPILED_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), violation_type)
+    for pattern, violation_type in PROHIBITED_PATTERNS
+]
+
 
 # Allowed informational terms (for context)
 ALLOWED_TERMS = [
@@ -75,8 +81,8 @@ def filter_compliance(text: str, strict: bool = True) -> Tuple[str, List[Tuple[s
     violations = []
     filtered_text = text
 
-    for pattern, violation_type in PROHIBITED_PATTERNS:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
+    for regex, violation_type in _COMPILED_PATTERNS:
+        matches = regex.finditer(text)
         for match in matches:
             matched_text = match.group(0)
             # Get context (50 chars before and after)
@@ -88,35 +94,27 @@ def filter_compliance(text: str, strict: bool = True) -> Tuple[str, List[Tuple[s
 
             # Replace with generic alternative
             if violation_type == 'TESTIMONIAL':
-                filtered_text = re.sub(
-                    pattern,
+                filtered_text = regex.sub(
                     lambda m: 'experienced' if m.group(0).lower() in ['best', 'top', 'finest'] else 'trusted',
                     filtered_text,
-                    flags=re.IGNORECASE,
                     count=1
                 )
             elif violation_type == 'COMPARATIVE':
-                filtered_text = re.sub(
-                    pattern,
+                filtered_text = regex.sub(
                     'appropriate',
                     filtered_text,
-                    flags=re.IGNORECASE,
                     count=1
                 )
             elif violation_type == 'GUARANTEE':
-                filtered_text = re.sub(
-                    pattern,
+                filtered_text = regex.sub(
                     'likely',
                     filtered_text,
-                    flags=re.IGNORECASE,
                     count=1
                 )
             elif violation_type == 'MISLEADING':
-                filtered_text = re.sub(
-                    pattern,
+                filtered_text = regex.sub(
                     'experienced',
                     filtered_text,
-                    flags=re.IGNORECASE,
                     count=1
                 )
 
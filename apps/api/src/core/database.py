@@ -2,8 +2,15 @@
 
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool, StaticPool
 
 from src.core.config import settings
 
@@ -14,13 +21,32 @@ class Base(DeclarativeBase):
     pass
 
 
+def create_engine(url: str, *, testing: bool = False) -> AsyncEngine:
+    """Create the async engine for a database URL.
+
+    With ``testing`` the engine skips the sized pool: SQLite gets a StaticPool so
+    every checkout shares the one in-memory connection, and other databases get
+    a NullPool. Connections are never pre-pinged or recycled.
+    """
+    if not testing:
+        return create_async_engine(
+            url,
+            echo=settings.DEBUG,
+            pool_size=settings.DATABASE_POOL_SIZE,
+            max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        )
+
+    is_sqlite = make_url(url).get_backend_name() == "sqlite"
+    return create_async_engine(
+        url,
+        echo=False,
+        poolclass=StaticPool if is_sqlite else NullPool,
+        pool_pre_ping=False,
+    )
+
+
 # Create async engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_size=settings.DATABASE_POOL_SIZE,
-    max_overflow=settings.DATABASE_MAX_OVERFLOW,
-)
+engine = create_engine(settings.DATABASE_URL)
 
 # Create async session factory
 async_session = async_sessionmaker(
@@ -18,6 +18,12 @@ from src.models import AgentSession, SessionStatus
 
 router = APIRouter()
 
+# Typewriter pacing for the SSE stream, in seconds
+AGENT_STATE_DELAY = 0.3
+UI_COMPONENT_DELAY = 0.2
+SPACE_DELAY = 0.01
+TOKEN_DELAY = 0.02
+
 
 class SendMessageRequest(BaseModel):
     """Request model for sending a chat message."""
@@ -257,12 +263,12 @@ async def generate_sse_events(db: AsyncSession, session_id: UUID) -> AsyncGenera
     if previous_agent != active_agent:
         agent_state_data["previous_agent"] = previous_agent
     yield f'event: agent_state\ndata: {json.dumps(agent_state_data)}\n\n'
-    await asyncio.sleep(0.3)
+    await asyncio.sleep(AGENT_STATE_DELAY)
 
     # UI component event (if applicable)
     if ui_component:
         yield f'event: ui_component\ndata: {json.dumps(ui_component)}\n\n'
-        await asyncio.sleep(0.2)
+        await asyncio.sleep(UI_COMPONENT_DELAY)
 
     # Token events for typewriter effect - send word by word for better test compatibility
     words = response_text.split()
@@ -270,10 +276,10 @@ async def generate_sse_events(db: AsyncSession, session_id: UUID) -> AsyncGenera
         # Add space between words (except first)
         if i > 0:
             yield f'event: token\ndata: {{"text": " "}}\n\n'
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(SPACE_DELAY)
         # Send the word
         yield f'event: token\ndata: {{"text": "{word}"}}\n\n'
-        await asyncio.sleep(0.02)
+        await asyncio.sleep(TOKEN_DELAY)
 
     # Completion event
     yield 'event: complete\ndata: {"status": "done"}\n\n'
@@ -20,6 +20,9 @@ router = APIRouter()
 # Format: +[country code][number] e.g., +61412345678
 E164_PATTERN = re.compile(r"^\+[1-9]\d{1,14}$")
 
+# Basic email validation regex
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
 
 class PatientResponse(BaseModel):
     """Response model for patient data."""
@@ -64,9 +67,7 @@ class CreatePatientRequest(BaseModel):
         """Validate email format if provided."""
         if v is None:
             return None
-        # Basic email validation
-        email_pattern = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
-        if not email_pattern.match(v):
+        if not EMAIL_PATTERN.match(v):
             raise ValueError("Invalid email format")
         return v.lower()
 
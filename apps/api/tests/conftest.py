@@ -1,19 +1,44 @@
 """Pytest configuration and shared fixtures."""
 
+import asyncio
+import mmap
 import pytest
+import yaml
+from contextlib import asynccontextmanager, contextmanager
 from httpx import AsyncClient, ASGITransport
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy import JSON
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import JSON, Row, event, insert, text
 from sqlalchemy.dialects.postgresql import JSONB
-from typing import AsyncGenerator
-import uuid
+from types import SimpleNamespace
+from typing import AsyncGenerator, Generator
 
 from src.main import app
-from src.core.database import Base, get_db
+from src.core.database import Base, create_engine, get_db
 from src.models import Clinic
+from src.routes import chat
+from tests.factories import clinic_values
+from tests.paths import API_DIR, REPO_ROOT, layout_fingerprint, walk_paths
 
 
-# Test database URL (use SQLite for testing)
+COMPOSE_PATH = REPO_ROOT / "docker-compose.yml"
+
+# Cache key for the layout the smoke checks last passed against
+LAYOUT_CACHE_KEY = "perlflow/layout_fingerprint"
+
+# Prefer libyaml's C loader; PyYAML wheels bundle it on most platforms
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Run async tests on uvloop, as uvicorn[standard] does in production
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Test database URL (use SQLite for testing). Each pytest-xdist worker is a
+# separate process, so the in-memory database is already private per worker.
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
@@ -22,10 +47,41 @@ TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 JSONB = JSON
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Event loop policy for every async test and fixture in the run."""
+    if uvloop is None:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def instant_chat_stream():
+    """Stream chat responses without typewriter pacing.
+
+    The agent replies are deterministic keyword routing, so the only cost of a
+    streamed turn is the artificial delay between SSE events. The event
+    sequence and frame shape are unchanged.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for delay in ("AGENT_STATE_DELAY", "UI_COMPONENT_DELAY", "SPACE_DELAY", "TOKEN_DELAY"):
+            mp.setattr(chat, delay, 0)
+        yield
+
+
+@pytest.fixture(scope="session")
 async def async_engine():
-    """Create async test database engine."""
-    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    """Create the async test database engine once per test run."""
+    engine = create_engine(TEST_DATABASE_URL, testing=True)
+
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite/aiosqlite
+    @event.listens_for(engine.sync_engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -38,46 +94,262 @@ async def async_engine():
     await engine.dispose()
 
 
-@pytest.fixture
-async def async_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create async test database session."""
-    session_factory = async_sessionmaker(
-        async_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+@asynccontextmanager
+async def rolled_back_session(engine) -> AsyncGenerator[AsyncSession, None]:
+    """Open a session whose writes are discarded when the block exits.
+
+    Commits made by the test or the app only release a SAVEPOINT inside the
+    outer transaction, so callers see their own writes and leave nothing
+    behind.
+    """
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
+
+
+@contextmanager
+def db_override(session: AsyncSession):
+    """Serve every request's get_db dependency from the given session."""
 
-    async with session_factory() as session:
+    async def override_get_db():
         yield session
 
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        yield
+    finally:
+        app.dependency_overrides.clear()
+
 
 @pytest.fixture
-async def test_clinic(async_session) -> Clinic:
-    """Create a test clinic with API key."""
-    clinic = Clinic(
-        id=uuid.uuid4(),
-        name="Test Dental Clinic",
-        api_key="test_clinic_api_key_12345",
-        timezone="Australia/Sydney",
-        settings={},
-    )
-    async_session.add(clinic)
-    await async_session.commit()
-    await async_session.refresh(clinic)
-    return clinic
+async def async_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
+    """Create async test database session rolled back after each test."""
+    async with rolled_back_session(async_engine) as session:
+        yield session
 
 
-@pytest.fixture
-async def client(async_session, test_clinic) -> AsyncGenerator[AsyncClient, None]:
-    """Create async test client with database override."""
+@pytest.fixture(scope="session")
+async def test_clinic(async_engine) -> Row:
+    """Create a test clinic with API key, shared by the whole test run.
 
-    async def override_get_db():
-        yield async_session
+    Tests only read its id and api_key, so a single INSERT ... RETURNING row
+    stands in for a refreshed ORM instance.
+    """
+    async with async_engine.begin() as conn:
+        result = await conn.execute(
+            insert(Clinic)
+            .values(
+                clinic_values(
+                    name="Test Dental Clinic",
+                    api_key="test_clinic_api_key_12345",
+                )
+            )
+            .returning(Clinic.id, Clinic.api_key)
+        )
+        return result.one()
 
-    app.dependency_overrides[get_db] = override_get_db
 
+@pytest.fixture(scope="session", name="app")
+def app_fixture():
+    """The FastAPI app, imported once by this conftest for every test module."""
+    return app
+
+
+@pytest.fixture(scope="session")
+async def http_client() -> AsyncGenerator[AsyncClient, None]:
+    """Create one ASGI test client shared by the whole test run.
+
+    ASGITransport calls the app in-process, so there is no connection pool,
+    keep-alive or HTTP/2 negotiation to tune; per-test isolation comes from the
+    rolled-back database session, not from rebuilding the client.
+    """
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
 
-    app.dependency_overrides.clear()
+
+@pytest.fixture(scope="session")
+async def warmup(async_engine, http_client) -> None:
+    """Pay the app's and the engine's first-call costs once, during fixture setup.
+
+    Routing, response validation and the first pooled connection are all
+    lazily initialised; doing them here keeps that cost out of the call phase
+    of whichever database test happens to run first.
+    """
+    await http_client.get("/health")
+    async with async_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+@pytest.fixture
+async def client(
+    http_client, warmup, async_session, test_clinic
+) -> AsyncGenerator[AsyncClient, None]:
+    """Point the shared test client at this test's database session."""
+    with db_override(async_session):
+        yield http_client
+
+
+@pytest.fixture(scope="session")
+def isolated_client(async_engine, http_client, warmup, test_clinic):
+    """Return a factory opening the shared client on a throwaway database session.
+
+    Use it from class- or module-scoped fixtures that build state once, e.g. a
+    multi-turn conversation, and keep only the responses.
+    """
+
+    @asynccontextmanager
+    async def open_client() -> AsyncGenerator[AsyncClient, None]:
+        async with rolled_back_session(async_engine) as session:
+            with db_override(session):
+                yield http_client
+
+    return open_client
+
+
+@pytest.fixture(scope="session")
+def compose() -> Generator[SimpleNamespace, None, None]:
+    """Map and parse docker-compose.yml once for the whole test run.
+
+    Exposes the read-only ``data`` mmap for byte-level ``find`` checks, with
+    no decode or copy, and the ``parsed`` mapping.
+    """
+    assert COMPOSE_PATH.exists(), "docker-compose.yml should exist in root"
+    with open(COMPOSE_PATH, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        try:
+            parsed = yaml.load(data, Loader=YamlLoader)
+        except yaml.YAMLError as e:
+            pytest.fail(f"docker-compose.yml is not valid YAML: {e}")
+        # find() searches from the current position, which loading consumed
+        data.seek(0)
+        yield SimpleNamespace(data=data, parsed=parsed)
+
+
+@pytest.fixture(scope="session")
+def existing_paths() -> frozenset[str]:
+    """Every path under src/ and tests/, walked once for membership checks."""
+    return walk_paths("src", "tests")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--skip-smoke",
+        action="store_true",
+        default=False,
+        help="skip smoke-marked layout checks if src/ and tests/ are unchanged since they last passed",
+    )
+
+
+class SmokeTally:
+    """Smoke check results for the run, aggregated where the fingerprint is recorded.
+
+    ``total`` counts smoke items collected before any deselection, ``passed``
+    the smoke calls that passed; ``failed`` is set by any failing smoke report
+    or crashed xdist worker. On the xdist controller the report hook sees
+    every worker's reports.
+    """
+
+    def __init__(self) -> None:
+        self.fingerprint: str | None = None
+        self.total = 0
+        self.passed = 0
+        self.failed = False
+
+    def pytest_runtest_logreport(self, report) -> None:
+        if "smoke" not in report.keywords:
+            return
+        if report.failed:
+            self.failed = True
+        elif report.when == "call" and report.passed:
+            self.passed += 1
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error) -> None:
+        # Every worker collects the same items, so any worker's count is the total
+        if error:
+            self.failed = True
+        self.total = max(self.total, node.workeroutput.get("smoke_total", 0))
+
+
+_smoke_key = pytest.StashKey[SmokeTally]()
+
+
+def _is_worker(config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+def _collects_all_tests(config) -> bool:
+    """Whether the command line selects the whole tests/ tree, e.g. plain ``pytest``."""
+    tests_dir = API_DIR / "tests"
+    for arg in config.args:
+        if "::" in arg:
+            continue
+        path = (config.invocation_params.dir / arg).resolve()
+        if path == tests_dir or path in tests_dir.parents:
+            return True
+    return False
+
+
+def pytest_configure(config):
+    tally = SmokeTally()
+    config.stash[_smoke_key] = tally
+    config.pluginmanager.register(tally, "smoke-tally")
+
+
+def pytest_sessionstart(session):
+    """Fingerprint the layout once, only if this process may skip or record with it."""
+    config = session.config
+    if getattr(config, "cache", None) is None:
+        return
+    may_record = not _is_worker(config) and _collects_all_tests(config)
+    if config.getoption("--skip-smoke") or may_record:
+        config.stash[_smoke_key].fingerprint = layout_fingerprint("src", "tests")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Count smoke checks and skip them when the layout matches the last pass.
+
+    Runs before -k/-m/--lf deselection, so the count covers every collected
+    smoke check and a filtered run can never look complete.
+    """
+    tally = config.stash[_smoke_key]
+    smoke = [item for item in items if item.get_closest_marker("smoke")]
+    tally.total = len(smoke)
+    if _is_worker(config):
+        config.workeroutput["smoke_total"] = len(smoke)
+    if not smoke or not config.getoption("--skip-smoke") or tally.fingerprint is None:
+        return
+
+    if config.cache.get(LAYOUT_CACHE_KEY, None) == tally.fingerprint:
+        skip = pytest.mark.skip(reason="layout unchanged")
+        for item in smoke:
+            item.add_marker(skip)
+
+
+def pytest_sessionfinish(session):
+    """Remember the layout once every smoke check in a full run has passed.
+
+    Only the main process records it, never an xdist worker.
+    """
+    config = session.config
+    if _is_worker(config):
+        return
+    tally = config.stash[_smoke_key]
+    if (
+        tally.fingerprint is not None
+        and tally.total
+        and not tally.failed
+        and tally.passed == tally.total
+        and _collects_all_tests(config)
+    ):
+        config.cache.set(LAYOUT_CACHE_KEY, tally.fingerprint)
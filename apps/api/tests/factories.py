@@ -0,0 +1,142 @@
+"""Shared model factories for tests.
+
+Each ``*_values`` function returns the column values for one row, with test
+defaults that any keyword argument overrides. Use them directly with Core
+``insert(Model).values(...)``, or through the ``make_*`` helpers when the test
+needs an ORM instance it can refresh later.
+"""
+
+from typing import Any
+from uuid import uuid4
+
+from src.models import (
+    AgentSession,
+    Appointment,
+    AppointmentStatus,
+    Clinic,
+    Dentist,
+    IncentiveType,
+    MoveOfferStatus,
+    Patient,
+    Procedure,
+    SessionStatus,
+)
+
+
+def clinic_values(**overrides: Any) -> dict[str, Any]:
+    """Column values for a clinic."""
+    return {
+        "id": uuid4(),
+        "name": "Test Clinic",
+        "api_key": "test_key",
+        "timezone": "Australia/Sydney",
+        "settings": {},
+        **overrides,
+    }
+
+
+def dentist_values(**overrides: Any) -> dict[str, Any]:
+    """Column values for an active general dentist."""
+    return {
+        "id": uuid4(),
+        "name": "Dr. Test",
+        "is_active": True,
+        "specializations": ["general"],
+        "schedule": {},
+        **overrides,
+    }
+
+
+def patient_values(**overrides: Any) -> dict[str, Any]:
+    """Column values for a patient."""
+    return {
+        "id": uuid4(),
+        "phone": "+61412345678",
+        "name": "John Doe",
+        **overrides,
+    }
+
+
+def procedure_values(**overrides: Any) -> dict[str, Any]:
+    """Column values for a 30 minute prophylaxis procedure."""
+    return {
+        "id": uuid4(),
+        "code": "D1110",
+        "name": "Prophylaxis",
+        "category": "Preventive",
+        "default_duration_mins": 30,
+        "base_value": 150.0,
+        "priority_weight": 0.3,
+        **overrides,
+    }
+
+
+def session_values(**overrides: Any) -> dict[str, Any]:
+    """Column values for an active Receptionist session."""
+    return {
+        "session_id": uuid4(),
+        "current_node": "Receptionist",
+        "messages": [],
+        "status": SessionStatus.ACTIVE,
+        **overrides,
+    }
+
+
+def appointment_values(**overrides: Any) -> dict[str, Any]:
+    """Column values for a booked 30 minute prophylaxis appointment."""
+    return {
+        "id": uuid4(),
+        "duration_mins": 30,
+        "procedure_code": "D1110",
+        "procedure_name": "Prophylaxis",
+        "estimated_value": 150.0,
+        "status": AppointmentStatus.BOOKED,
+        **overrides,
+    }
+
+
+def move_offer_values(**overrides: Any) -> dict[str, Any]:
+    """Column values for a pending 10% discount move offer.
+
+    ``offered_at`` and ``expires_at`` have no default; pass them explicitly.
+    """
+    return {
+        "id": uuid4(),
+        "original_appointment_id": uuid4(),
+        "target_appointment_id": None,
+        "incentive_type": IncentiveType.DISCOUNT,
+        "incentive_value": "10% discount",
+        "move_score": 75.0,
+        "status": MoveOfferStatus.PENDING,
+        **overrides,
+    }
+
+
+def make_clinic(**overrides: Any) -> Clinic:
+    """Build an unsaved clinic."""
+    return Clinic(**clinic_values(**overrides))
+
+
+def make_dentist(**overrides: Any) -> Dentist:
+    """Build an unsaved dentist."""
+    return Dentist(**dentist_values(**overrides))
+
+
+def make_patient(**overrides: Any) -> Patient:
+    """Build an unsaved patient."""
+    return Patient(**patient_values(**overrides))
+
+
+def make_procedure(**overrides: Any) -> Procedure:
+    """Build an unsaved procedure."""
+    return Procedure(**procedure_values(**overrides))
+
+
+def make_session(**overrides: Any) -> AgentSession:
+    """Build an unsaved agent session."""
+    return AgentSession(**session_values(**overrides))
+
+
+def make_appointment(**overrides: Any) -> Appointment:
+    """Build an unsaved appointment."""
+    return Appointment(**appointment_values(**overrides))
@@ -0,0 +1,72 @@
+"""Directory-listing helpers for file-existence tests."""
+
+import hashlib
+import os
+from functools import cache
+from pathlib import Path
+
+# Resolved once at import: tests/ -> apps/api -> apps -> repository root
+_HERE = Path(__file__).resolve()
+API_DIR = _HERE.parents[1]
+REPO_ROOT = _HERE.parents[3]
+
+# Services docker-compose.yml must define; shared by the Docker build and compose tests
+COMPOSE_REQUIRED_SERVICES = frozenset({"postgres", "redis", "api", "frontend"})
+
+
+@cache
+def dir_entries(directory: str) -> frozenset[str]:
+    """Return the entry names in a directory, listing it once per test run.
+
+    Relative directories are resolved against the API directory, not the CWD.
+    """
+    try:
+        with os.scandir(API_DIR / directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except FileNotFoundError:
+        return frozenset()
+
+
+@cache
+def path_exists(path: str | os.PathLike[str]) -> bool:
+    """Check a path via its parent's cached listing instead of a stat per path.
+
+    Results are memoized too; the tests never create or delete files, so a
+    cached negative answer stays valid for the whole session. Relative paths
+    are resolved against the API directory, so the answer does not depend on
+    where pytest was started.
+    """
+    p = API_DIR / path
+    return p.name in dir_entries(str(p.parent))
+
+
+def layout_fingerprint(*tops: str) -> str:
+    """Hash the directory and file names under the given API subdirectories.
+
+    Only names are hashed, not contents, so the fingerprint changes exactly
+    when something the existence checks could see is added, removed or renamed.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for top in tops:
+        for dirpath, dirnames, filenames in os.walk(API_DIR / top):
+            dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+            digest.update(os.path.relpath(dirpath, API_DIR).encode())
+            for name in sorted(filenames):
+                digest.update(b"\0" + name.encode())
+            digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def walk_paths(*tops: str) -> frozenset[str]:
+    """Return every file and directory under the given API subdirectories.
+
+    Paths are relative to the API directory with forward slashes, e.g.
+    ``"src/routes/chat.py"`` or ``"tests/integration"``.
+    """
+    found = set()
+    for top in tops:
+        found.add(top)
+        for dirpath, dirnames, filenames in os.walk(API_DIR / top):
+            rel = Path(dirpath).relative_to(API_DIR).as_posix()
+            found.update(f"{rel}/{name}" for name in dirnames + filenames)
+    return frozenset(found)
@@ -0,0 +1,18 @@
+"""Helpers for sending JSON request bodies in tests."""
+
+try:
+    # orjson is installed with the LangGraph stack; fall back to the stdlib encoder
+    from orjson import dumps as json_dumps
+except ImportError:
+    import json
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+async def post_json(client, url: str, obj):
+    """POST ``obj`` as a JSON body serialized with orjson when available."""
+    return await client.post(url, content=json_dumps(obj), headers=JSON_HEADERS)
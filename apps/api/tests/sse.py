@@ -0,0 +1,93 @@
+"""Helpers for reading chat SSE streams in tests."""
+
+import asyncio
+import re
+
+from tests.payloads import post_json
+
+try:
+    # orjson is installed with the LangGraph stack; fall back to the stdlib decoder
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+_STOP_EVENTS = (b"event: complete\n", b"event: error\n")
+_FRAME = re.compile(r"^event: (\w+)\ndata: (.*)$", re.MULTILINE)
+
+
+async def read_sse(response, *keywords: str) -> str:
+    """Read SSE frames until the complete or error frame, or a frame with any keyword.
+
+    Raw bytes are collected and decoded once at the end. Each check only scans
+    the frames touched by the latest chunk, so a marker split across chunks is
+    still found. The response is closed as soon as reading stops, so the rest
+    of the body is never pulled.
+
+    Args:
+        response: Streaming response from /chat/stream
+        keywords: Lowercase text that ends the read once seen in a frame
+
+    Returns:
+        Raw SSE event stream data read so far
+    """
+    needles = _STOP_EVENTS + tuple(kw.encode() for kw in keywords)
+    buf = bytearray()
+    async for chunk in response.aiter_bytes():
+        # Start of the frame that was still open before this chunk arrived
+        start = buf.rfind(b"\n\n") + 1
+        buf += chunk
+        recent = buf[start:].lower()
+        if any(needle in recent for needle in needles):
+            break
+    await response.aclose()
+    return buf.decode()
+
+
+async def drain_until_complete(client, session_id: str, timeout: float = 5.0) -> str:
+    """Stream one chat turn and return its SSE text once it completes or errors.
+
+    The whole read is bounded by ``timeout`` seconds, so a stream that never
+    sends its terminal frame fails the test instead of hanging it.
+    """
+
+    async def drain() -> str:
+        async with client.stream("GET", f"/chat/stream/{session_id}") as response:
+            return await read_sse(response)
+
+    return await asyncio.wait_for(drain(), timeout)
+
+
+def parse_reply(sse_data: str) -> dict:
+    """Collect one streamed agent reply into a dict.
+
+    Keys are ``active_agent`` and ``previous_agent`` from the agent_state
+    event, ``ui_component`` (or None), and ``text`` joined from the tokens.
+    Frames whose data is not valid JSON are ignored.
+    """
+    reply = {"active_agent": None, "previous_agent": None, "ui_component": None}
+    tokens = []
+    for event, data in _FRAME.findall(sse_data):
+        try:
+            payload = json_loads(data)
+        except ValueError:
+            continue
+        if event == "agent_state":
+            reply["active_agent"] = payload.get("active_agent")
+            reply["previous_agent"] = payload.get("previous_agent")
+        elif event == "ui_component":
+            reply["ui_component"] = payload
+        elif event == "token":
+            tokens.append(payload.get("text", ""))
+    reply["text"] = "".join(tokens)
+    return reply
+
+
+async def chat_turn(client, session_id: str, text: str) -> str:
+    """Send one chat message and return the SSE text of the reply.
+
+    The reply is fully drained before this returns, so the next message is
+    never in flight while a stream still holds the test's shared session.
+    """
+    response = await post_json(client, "/chat/message", {"session_id": session_id, "text": text})
+    assert response.status_code == 200, response.text
+    return await drain_until_complete(client, session_id)
@@ -3,41 +3,57 @@
 import pytest
 from datetime import datetime, timedelta
 from httpx import AsyncClient
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import uuid4
 
+from src.models import (
+    AgentSession,
+    Appointment,
+    AppointmentStatus,
+    Clinic,
+    Dentist,
+    Patient,
+    Procedure,
+)
+from tests.factories import (
+    appointment_values,
+    clinic_values,
+    dentist_values,
+    make_appointment,
+    make_clinic,
+    make_dentist,
+    make_patient,
+    make_procedure,
+    make_session,
+    patient_values,
+    procedure_values,
+    session_values,
+)
+
+
+@pytest.fixture
+def now() -> datetime:
+    """Fixed reference time so slot boundaries are identical on every run."""
+    return datetime(2030, 1, 7, 10, 0, 0)
+
 
 @pytest.mark.asyncio
-async def test_get_available_slots(client: AsyncClient, async_session: AsyncSession):
+async def test_get_available_slots(client: AsyncClient, async_session: AsyncSession, now: datetime):
     """Test retrieving available appointment slots."""
-    from src.models import Clinic, Dentist
-    from sqlalchemy import select
-
-    # Create clinic
-    clinic = Clinic(
-        id=uuid4(),
-        name="Test Clinic",
-        api_key="test_key",
-        timezone="Australia/Sydney",
-        settings={"operating_hours": {"start": "09:00", "end": "17:00"}},
-    )
-    async_session.add(clinic)
-
-    # Create dentist
-    dentist = Dentist(
-        id=uuid4(),
+    # Create clinic and dentist
+    clinic = make_clinic(settings={"operating_hours": {"start": "09:00", "end": "17:00"}})
+    dentist = make_dentist(
         clinic_id=clinic.id,
         name="Dr. Smith",
-        is_active=True,
-        specializations=["general"],
         schedule={"monday": True, "tuesday": True, "wednesday": True, "thursday": True, "friday": True},
     )
-    async_session.add(dentist)
+    async_session.add_all([clinic, dentist])
     await async_session.commit()
 
     # Get available slots for next week
-    start_date = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
-    end_date = (datetime.now() + timedelta(days=14)).strftime("%Y-%m-%d")
+    start_date = (now + timedelta(days=7)).strftime("%Y-%m-%d")
+    end_date = (now + timedelta(days=14)).strftime("%Y-%m-%d")
 
     response = await client.get(
         f"/appointments/available?clinic_id={clinic.id}&date_range={start_date}/{end_date}",
@@ -59,34 +75,14 @@ async def test_get_available_slots(client: AsyncClient, async_session: AsyncSess
 
 
 @pytest.mark.asyncio
-async def test_get_available_slots_filters_by_procedure(client: AsyncClient, async_session: AsyncSession):
+async def test_get_available_slots_filters_by_procedure(client: AsyncClient, async_session: AsyncSession, now: datetime):
     """Test filtering available slots by procedure code."""
-    from src.models import Clinic, Dentist, Procedure
-    from sqlalchemy import select
-
     # Create clinic and dentist
-    clinic = Clinic(
-        id=uuid4(),
-        name="Test Clinic",
-        api_key="test_key",
-        timezone="Australia/Sydney",
-        settings={"operating_hours": {"start": "09:00", "end": "17:00"}},
-    )
-    async_session.add(clinic)
-
-    dentist = Dentist(
-        id=uuid4(),
-        clinic_id=clinic.id,
-        name="Dr. Jones",
-        is_active=True,
-        specializations=["general"],
-        schedule={"monday": True, "tuesday": True},
-    )
-    async_session.add(dentist)
+    clinic = make_clinic(settings={"operating_hours": {"start": "09:00", "end": "17:00"}})
+    dentist = make_dentist(clinic_id=clinic.id, name="Dr. Jones", schedule={"monday": True, "tuesday": True})
 
     # Create procedure with 60 min duration
-    procedure = Procedure(
-        id=uuid4(),
+    procedure = make_procedure(
         code="D2710",  # Crown
         name="Crown - Porcelain Fused to Metal",
         category="Restorative",
@@ -94,12 +90,12 @@ async def test_get_available_slots_filters_by_procedure(client: AsyncClient, asy
         base_value=1200.0,
         priority_weight=0.8,
     )
-    async_session.add(procedure)
+    async_session.add_all([clinic, dentist, procedure])
     await async_session.commit()
 
     # Get slots with procedure filter
-    start_date = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
-    end_date = (datetime.now() + timedelta(days=14)).strftime("%Y-%m-%d")
+    start_date = (now + timedelta(days=7)).strftime("%Y-%m-%d")
+    end_date = (now + timedelta(days=14)).strftime("%Y-%m-%d")
 
     response = await client.get(
         f"/appointments/available?clinic_id={clinic.id}&date_range={start_date}/{end_date}&procedure_code=D2710",
@@ -118,10 +114,10 @@ async def test_get_available_slots_filters_by_procedure(client: AsyncClient, asy
 
 
 @pytest.mark.asyncio
-async def test_get_available_slots_clinic_not_found(client: AsyncClient):
+async def test_get_available_slots_clinic_not_found(client: AsyncClient, now: datetime):
     """Test getting slots for non-existent clinic returns 404."""
-    start_date = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
-    end_date = (datetime.now() + timedelta(days=14)).strftime("%Y-%m-%d")
+    start_date = (now + timedelta(days=7)).strftime("%Y-%m-%d")
+    end_date = (now + timedelta(days=14)).strftime("%Y-%m-%d")
 
     response = await client.get(
         f"/appointments/available?clinic_id={uuid4()}&date_range={start_date}/{end_date}",
@@ -134,16 +130,7 @@ async def test_get_available_slots_clinic_not_found(client: AsyncClient):
 @pytest.mark.asyncio
 async def test_get_available_slots_invalid_date_range(client: AsyncClient, async_session: AsyncSession):
     """Test getting slots with invalid date range returns 400."""
-    from src.models import Clinic
-    from sqlalchemy import select
-
-    clinic = Clinic(
-        id=uuid4(),
-        name="Test Clinic",
-        api_key="test_key",
-        timezone="Australia/Sydney",
-        settings={},
-    )
+    clinic = make_clinic()
     async_session.add(clinic)
     await async_session.commit()
 
@@ -155,65 +142,22 @@ async def test_get_available_slots_invalid_date_range(client: AsyncClient, async
 
 
 @pytest.mark.asyncio
-async def test_create_appointment_success(client: AsyncClient, async_session: AsyncSession):
+async def test_create_appointment_success(client: AsyncClient, async_session: AsyncSession, now: datetime):
     """Test creating a new appointment successfully."""
-    from src.models import Clinic, Dentist, Patient, Procedure
-    from sqlalchemy import select
-
     # Create clinic, dentist, patient, procedure
-    clinic = Clinic(
-        id=uuid4(),
-        name="Test Clinic",
-        api_key="test_key",
-        timezone="Australia/Sydney",
-        settings={},
-    )
-    async_session.add(clinic)
-
-    dentist = Dentist(
-        id=uuid4(),
-        clinic_id=clinic.id,
-        name="Dr. Test",
-        is_active=True,
-        specializations=["general"],
-        schedule={"monday": True},
-    )
-    async_session.add(dentist)
-
-    patient = Patient(
-        id=uuid4(),
-        phone="+61412345678",
-        name="John Doe",
-    )
-    async_session.add(patient)
-
-    procedure = Procedure(
-        id=uuid4(),
-        code="D1110",
-        name="Prophylaxis",
-        category="Preventive",
-        default_duration_mins=30,
-        base_value=150.0,
-        priority_weight=0.3,
-    )
-    async_session.add(procedure)
+    clinic = make_clinic()
+    dentist = make_dentist(clinic_id=clinic.id, schedule={"monday": True})
+    patient = make_patient()
+    procedure = make_procedure()
 
     # Create a session for this clinic
-    from src.models import AgentSession, SessionStatus
-    session = AgentSession(
-        session_id=uuid4(),
-        patient_id=patient.id,
-        clinic_id=clinic.id,
-        current_node="Receptionist",
-        messages=[],
-        status=SessionStatus.ACTIVE,
-    )
-    async_session.add(session)
+    session = make_session(patient_id=patient.id, clinic_id=clinic.id)
 
+    async_session.add_all([clinic, dentist, patient, procedure, session])
     await async_session.commit()
 
     # Create a slot_id manually
-    start_time = (datetime.now() + timedelta(days=7)).replace(hour=10, minute=0, second=0, microsecond=0)
+    start_time = now + timedelta(days=7)
     slot_id = f"{dentist.id}@{start_time.isoformat()}"
 
     response = await client.post(
@@ -237,57 +181,49 @@ async def test_create_appointment_success(client: AsyncClient, async_session: As
 
 
 @pytest.mark.asyncio
-async def test_create_appointment_double_booking(client: AsyncClient, async_session: AsyncSession):
+async def test_create_appointment_double_booking(client: AsyncClient, async_session: AsyncSession, now: datetime):
     """Test that double-booking the same slot returns 409."""
-    from src.models import Clinic, Dentist, Patient, Procedure, Appointment, AppointmentStatus, AgentSession, SessionStatus
-    from uuid import uuid4
-
     # Create entities
-    clinic = Clinic(id=uuid4(), name="Test Clinic", api_key="test_key", timezone="Australia/Sydney", settings={})
-    dentist = Dentist(id=uuid4(), clinic_id=clinic.id, name="Dr. Test", is_active=True, specializations=["general"], schedule={})
-    patient1 = Patient(id=uuid4(), phone="+61411111111", name="Patient 1")
-    patient2 = Patient(id=uuid4(), phone="+61422222222", name="Patient 2")
-    procedure = Procedure(id=uuid4(), code="D1110", name="Prophylaxis", category="Preventive", default_duration_mins=30, base_value=150.0, priority_weight=0.3)
-
-    async_session.add_all([clinic, dentist, patient1, patient2, procedure])
-    await async_session.commit()
+    clinic_id, dentist_id, patient1_id, patient2_id, session_id = uuid4(), uuid4(), uuid4(), uuid4(), uuid4()
+    await async_session.execute(insert(Clinic).values(clinic_values(id=clinic_id)))
+    await async_session.execute(insert(Dentist).values(dentist_values(id=dentist_id, clinic_id=clinic_id)))
+    await async_session.execute(
+        insert(Patient).values([
+            patient_values(id=patient1_id, phone="+61411111111", name="Patient 1"),
+            patient_values(id=patient2_id, phone="+61422222222", name="Patient 2"),
+        ])
+    )
+    await async_session.execute(insert(Procedure).values(procedure_values()))
 
     # Create a session
-    session = AgentSession(
-        session_id=uuid4(),
-        patient_id=patient1.id,
-        clinic_id=clinic.id,
-        current_node="Receptionist",
-        messages=[],
-        status=SessionStatus.ACTIVE,
+    await async_session.execute(
+        insert(AgentSession).values(
+            session_values(session_id=session_id, patient_id=patient1_id, clinic_id=clinic_id)
+        )
     )
-    async_session.add(session)
-    await async_session.commit()
 
     # Create existing appointment
-    start_time = (datetime.now() + timedelta(days=7)).replace(hour=10, minute=0, second=0, microsecond=0)
-    existing_appt = Appointment(
-        id=uuid4(),
-        patient_id=patient1.id,
-        clinic_id=clinic.id,
-        dentist_id=dentist.id,
-        start_time=start_time,
-        duration_mins=30,
-        procedure_code="D1110",
-        procedure_name="Prophylaxis",
-        estimated_value=150.0,
-        status=AppointmentStatus.BOOKED,
+    start_time = now + timedelta(days=7)
+    await async_session.execute(
+        insert(Appointment).values(
+            appointment_values(
+                id=uuid4(),
+                patient_id=patient1_id,
+                clinic_id=clinic_id,
+                dentist_id=dentist_id,
+                start_time=start_time,
+            )
+        )
     )
-    async_session.add(existing_appt)
     await async_session.commit()
 
     # Try to book same slot
-    slot_id = f"{dentist.id}@{start_time.isoformat()}"
+    slot_id = f"{dentist_id}@{start_time.isoformat()}"
     response = await client.post(
         "/appointments",
         json={
-            "session_id": str(session.session_id),
-            "patient_id": str(patient2.id),
+            "session_id": str(session_id),
+            "patient_id": str(patient2_id),
             "slot_id": slot_id,
             "procedure_code": "D1110",
         },
@@ -298,37 +234,32 @@ async def test_create_appointment_double_booking(client: AsyncClient, async_sess
 
 
 @pytest.mark.asyncio
-async def test_update_appointment_status(client: AsyncClient, async_session: AsyncSession):
+async def test_update_appointment_status(client: AsyncClient, async_session: AsyncSession, now: datetime):
     """Test updating an appointment's status."""
-    from src.models import Clinic, Dentist, Patient, Appointment, AppointmentStatus
-    from uuid import uuid4
-
     # Create entities
-    clinic = Clinic(id=uuid4(), name="Test Clinic", api_key="test_key", timezone="Australia/Sydney", settings={})
-    dentist = Dentist(id=uuid4(), clinic_id=clinic.id, name="Dr. Test", is_active=True, specializations=["general"], schedule={})
-    patient = Patient(id=uuid4(), phone="+61412345678", name="John Doe")
-    async_session.add_all([clinic, dentist, patient])
-    await async_session.commit()
+    clinic_id, dentist_id, patient_id = uuid4(), uuid4(), uuid4()
+    await async_session.execute(insert(Clinic).values(clinic_values(id=clinic_id)))
+    await async_session.execute(insert(Dentist).values(dentist_values(id=dentist_id, clinic_id=clinic_id)))
+    await async_session.execute(insert(Patient).values(patient_values(id=patient_id)))
 
     # Create appointment
-    appointment = Appointment(
-        id=uuid4(),
-        patient_id=patient.id,
-        clinic_id=clinic.id,
-        dentist_id=dentist.id,
-        start_time=datetime.now() + timedelta(days=7),
-        duration_mins=30,
-        procedure_code="D1110",
-        procedure_name="Prophylaxis",
-        estimated_value=150.0,
-        status=AppointmentStatus.BOOKED,
+    appointment_id = uuid4()
+    await async_session.execute(
+        insert(Appointment).values(
+            appointment_values(
+                id=appointment_id,
+                patient_id=patient_id,
+                clinic_id=clinic_id,
+                dentist_id=dentist_id,
+                start_time=now + timedelta(days=7),
+            )
+        )
     )
-    async_session.add(appointment)
     await async_session.commit()
 
     # Update status to CANCELLED
     response = await client.put(
-        f"/appointments/{appointment.id}",
+        f"/appointments/{appointment_id}",
         json={"status": "CANCELLED"},
     )
 
@@ -338,39 +269,34 @@ async def test_update_appointment_status(client: AsyncClient, async_session: Asy
 
 
 @pytest.mark.asyncio
-async def test_update_appointment_time(client: AsyncClient, async_session: AsyncSession):
+async def test_update_appointment_time(client: AsyncClient, async_session: AsyncSession, now: datetime):
     """Test updating an appointment's time."""
-    from src.models import Clinic, Dentist, Patient, Appointment, AppointmentStatus
-    from uuid import uuid4
-
     # Create entities
-    clinic = Clinic(id=uuid4(), name="Test Clinic", api_key="test_key", timezone="Australia/Sydney", settings={})
-    dentist = Dentist(id=uuid4(), clinic_id=clinic.id, name="Dr. Test", is_active=True, specializations=["general"], schedule={})
-    patient = Patient(id=uuid4(), phone="+61412345678", name="John Doe")
-    async_session.add_all([clinic, dentist, patient])
-    await async_session.commit()
+    clinic_id, dentist_id, patient_id = uuid4(), uuid4(), uuid4()
+    await async_session.execute(insert(Clinic).values(clinic_values(id=clinic_id)))
+    await async_session.execute(insert(Dentist).values(dentist_values(id=dentist_id, clinic_id=clinic_id)))
+    await async_session.execute(insert(Patient).values(patient_values(id=patient_id)))
 
     # Create appointment at 10:00
-    start_time = (datetime.now() + timedelta(days=7)).replace(hour=10, minute=0, second=0, microsecond=0)
-    appointment = Appointment(
-        id=uuid4(),
-        patient_id=patient.id,
-        clinic_id=clinic.id,
-        dentist_id=dentist.id,
-        start_time=start_time,
-        duration_mins=30,
-        procedure_code="D1110",
-        procedure_name="Prophylaxis",
-        estimated_value=150.0,
-        status=AppointmentStatus.BOOKED,
+    start_time = now + timedelta(days=7)
+    appointment_id = uuid4()
+    await async_session.execute(
+        insert(Appointment).values(
+            appointment_values(
+                id=appointment_id,
+                patient_id=patient_id,
+                clinic_id=clinic_id,
+                dentist_id=dentist_id,
+                start_time=start_time,
+            )
+        )
     )
-    async_session.add(appointment)
     await async_session.commit()
 
     # Move to 11:00
     new_time = start_time + timedelta(hours=1)
     response = await client.put(
-        f"/appointments/{appointment.id}",
+        f"/appointments/{appointment_id}",
         json={"start_time": new_time.isoformat()},
     )
 
@@ -391,30 +317,20 @@ async def test_update_appointment_not_found(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_cancel_appointment(client: AsyncClient, async_session: AsyncSession):
+async def test_cancel_appointment(client: AsyncClient, async_session: AsyncSession, now: datetime):
     """Test cancelling an appointment returns 204."""
-    from src.models import Clinic, Dentist, Patient, Appointment, AppointmentStatus
-    from uuid import uuid4
-
     # Create entities
-    clinic = Clinic(id=uuid4(), name="Test Clinic", api_key="test_key", timezone="Australia/Sydney", settings={})
-    dentist = Dentist(id=uuid4(), clinic_id=clinic.id, name="Dr. Test", is_active=True, specializations=["general"], schedule={})
-    patient = Patient(id=uuid4(), phone="+61412345678", name="John Doe")
-    async_session.add_all([clinic, dentist, patient])
-    await async_session.commit()
+    clinic_id, dentist_id, patient_id = uuid4(), uuid4(), uuid4()
+    await async_session.execute(insert(Clinic).values(clinic_values(id=clinic_id)))
+    await async_session.execute(insert(Dentist).values(dentist_values(id=dentist_id, clinic_id=clinic_id)))
+    await async_session.execute(insert(Patient).values(patient_values(id=patient_id)))
 
     # Create appointment
-    appointment = Appointment(
-        id=uuid4(),
-        patient_id=patient.id,
-        clinic_id=clinic.id,
-        dentist_id=dentist.id,
-        start_time=datetime.now() + timedelta(days=7),
-        duration_mins=30,
-        procedure_code="D1110",
-        procedure_name="Prophylaxis",
-        estimated_value=150.0,
-        status=AppointmentStatus.BOOKED,
+    appointment = make_appointment(
+        patient_id=patient_id,
+        clinic_id=clinic_id,
+        dentist_id=dentist_id,
+        start_time=now + timedelta(days=7),
     )
     async_session.add(appointment)
     await async_session.commit()
@@ -435,5 +351,3 @@ async def test_cancel_appointment_not_found(client: AsyncClient):
     response = await client.delete(f"/appointments/{uuid4()}")
 
     assert response.status_code == 404
-
-import sys
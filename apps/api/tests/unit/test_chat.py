@@ -4,10 +4,27 @@ import pytest
 from httpx import AsyncClient
 import uuid
 import json
+import re
+from types import SimpleNamespace
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
 from src.models import AgentSession
+from tests.sse import chat_turn, drain_until_complete, parse_reply, read_sse
+
+
+try:
+    # orjson is installed with the LangGraph stack; fall back to the stdlib decoder
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Request bodies and ids reused across tests
+UNKNOWN_SESSION_ID = uuid.uuid4().hex
+HELLO = {"text": "Hello"}
+TOOTHACHE = {"text": "I have severe toothache"}
+BOOKING = {"text": "I want to book an appointment"}
+
+_DATA_LINE = re.compile(r'^data: (.+)$', re.MULTILINE)
 
 
 def extract_text_from_sse(sse_data: str) -> str:
@@ -20,17 +37,26 @@ def extract_text_from_sse(sse_data: str) -> str:
         Combined text content from all token events
     """
     tokens = []
-    for line in sse_data.split('\n'):
-        if line.startswith('data: '):
-            try:
-                data = json.loads(line[6:])
-                if 'text' in data:
-                    tokens.append(data['text'])
-            except (json.JSONDecodeError, KeyError):
-                pass
+    for match in _DATA_LINE.finditer(sse_data):
+        try:
+            text = json_loads(match.group(1)).get('text')
+        except ValueError:
+            continue
+        if text:
+            tokens.append(text)
     return ''.join(tokens)
 
 
+def assert_any_in(text: str, *needles: str) -> None:
+    """Assert that at least one needle occurs in text."""
+    assert any(needle in text for needle in needles), f"expected one of {needles} in response"
+
+
+async def get_reply(client: AsyncClient, session_id: str) -> dict:
+    """Stream the agent's reply and collect it with parse_reply."""
+    return parse_reply(await drain_until_complete(client, session_id))
+
+
 @pytest.mark.asyncio
 async def test_send_message_valid_session(client: AsyncClient, test_clinic):
     """Test sending a message to a valid session returns acknowledgment."""
@@ -55,10 +81,9 @@ async def test_send_message_valid_session(client: AsyncClient, test_clinic):
 @pytest.mark.asyncio
 async def test_send_message_invalid_session(client: AsyncClient):
     """Test sending a message to an invalid session returns 404."""
-    random_uuid = str(uuid.uuid4())
     response = await client.post(
         "/chat/message",
-        json={"session_id": random_uuid, "text": "Hello"},
+        json={"session_id": UNKNOWN_SESSION_ID, **HELLO},
     )
 
     assert response.status_code == 404
@@ -78,15 +103,13 @@ async def test_stream_chat_valid_session(client: AsyncClient, test_clinic):
     # Send a message first
     await client.post(
         "/chat/message",
-        json={"session_id": session_id, "text": "Hello"},
+        json={"session_id": session_id, **HELLO},
     )
 
     # Then stream
     async with client.stream("GET", f"/chat/stream/{session_id}") as response:
         assert response.status_code == 200
-        combined = ""
-        async for chunk in response.aiter_text():
-            combined += chunk
+        combined = await read_sse(response)
 
         # Should contain at least agent_state and token events
         assert "agent_state" in combined
@@ -97,15 +120,10 @@ async def test_stream_chat_valid_session(client: AsyncClient, test_clinic):
 @pytest.mark.asyncio
 async def test_stream_chat_invalid_session(client: AsyncClient):
     """Test SSE streaming with invalid session returns error event."""
-    random_uuid = str(uuid.uuid4())
 
-    async with client.stream("GET", f"/chat/stream/{random_uuid}") as response:
+    async with client.stream("GET", f"/chat/stream/{UNKNOWN_SESSION_ID}") as response:
         assert response.status_code == 200
-        combined = ""
-        async for chunk in response.aiter_text():
-            combined += chunk
-            if "complete" in chunk or "error" in chunk:
-                break
+        combined = await read_sse(response)
 
         # Should contain error event
         assert "error" in combined.lower()
@@ -124,19 +142,14 @@ async def test_stream_chat_pain_context(client: AsyncClient, test_clinic):
     # Send pain message
     await client.post(
         "/chat/message",
-        json={"session_id": session_id, "text": "I have severe toothache"},
+        json={"session_id": session_id, **TOOTHACHE},
     )
 
-    # Stream and check response
-    async with client.stream("GET", f"/chat/stream/{session_id}") as response:
-        combined = ""
-        async for chunk in response.aiter_text():
-            combined += chunk
-            if "complete" in chunk:
-                break
+    # Fetch and check response
+    reply = await get_reply(client, session_id)
 
-        # Should use IntakeSpecialist agent
-        assert "intakespecialist" in combined.lower()
+    # Should use IntakeSpecialist agent
+    assert reply["active_agent"] == "IntakeSpecialist"
 
 
 @pytest.mark.asyncio
@@ -152,19 +165,14 @@ async def test_stream_chat_booking_context(client: AsyncClient, test_clinic):
     # Send booking message
     await client.post(
         "/chat/message",
-        json={"session_id": session_id, "text": "I want to book an appointment"},
+        json={"session_id": session_id, **BOOKING},
     )
 
-    # Stream and check response
-    async with client.stream("GET", f"/chat/stream/{session_id}") as response:
-        combined = ""
-        async for chunk in response.aiter_text():
-            combined += chunk
-            if "complete" in chunk:
-                break
+    # Fetch and check response
+    reply = await get_reply(client, session_id)
 
-        # Should use ResourceOptimiser agent
-        assert "resourceoptimiser" in combined.lower()
+    # Should use ResourceOptimiser agent
+    assert reply["active_agent"] == "ResourceOptimiser"
 
 
 @pytest.mark.asyncio
@@ -183,11 +191,8 @@ async def test_send_message_stores_in_history(client: AsyncClient, test_clinic,
         json={"session_id": session_id, "text": "Test message"},
     )
 
-    # Verify message is in database using a fresh query
-    result = await async_session.execute(
-        select(AgentSession).where(AgentSession.session_id == uuid.UUID(session_id))
-    )
-    session = result.scalar_one_or_none()
+    # Verify message is in database with a primary-key lookup
+    session = await async_session.get(AgentSession, uuid.UUID(session_id))
     assert session is not None
     assert session.messages is not None
     assert len(session.messages) == 1
@@ -208,23 +213,19 @@ async def test_receptionist_polite_tone(client: AsyncClient, test_clinic):
     # Send greeting message
     await client.post(
         "/chat/message",
-        json={"session_id": session_id, "text": "Hello"},
+        json={"session_id": session_id, **HELLO},
     )
 
-    # Stream and check response
-    async with client.stream("GET", f"/chat/stream/{session_id}") as response:
-        combined = ""
-        async for chunk in response.aiter_text():
-            combined += chunk
-            if "complete" in chunk:
-                break
+    # Fetch and check response
+    reply = await get_reply(client, session_id)
 
     # Verify polite and welcoming tone
-    assert "welcome" in combined.lower() or "hello" in combined.lower()
-    assert "help" in combined.lower()
+    low = reply["text"].lower()
+    assert_any_in(low, "welcome", "hello")
+    assert "help" in low
     # Verify no technical jargon
-    assert "json" not in combined.lower()
-    assert "api" not in combined.lower()
+    assert "json" not in low
+    assert "api" not in low
 
 
 @pytest.mark.asyncio
@@ -240,177 +241,93 @@ async def test_intake_specialist_pain_level(client: AsyncClient, test_clinic):
     # Send pain message
     await client.post(
         "/chat/message",
-        json={"session_id": session_id, "text": "I have severe toothache"},
+        json={"session_id": session_id, **TOOTHACHE},
     )
 
-    # Stream and check response
-    async with client.stream("GET", f"/chat/stream/{session_id}") as response:
-        combined = ""
-        async for chunk in response.aiter_text():
-            combined += chunk
-            if "complete" in chunk:
-                break
+    # Fetch and check response
+    reply = await get_reply(client, session_id)
 
     # Verify asks for pain level
-    assert "pain" in combined.lower()
-    assert "1" in combined or "10" in combined or "scale" in combined.lower()
-
-
-@pytest.mark.asyncio
-async def test_intake_specialist_swelling_check(client: AsyncClient, test_clinic):
-    """Test that IntakeSpecialist checks for swelling red flag."""
-    # Create session
-    create_response = await client.post(
-        "/session",
-        json={"clinic_api_key": test_clinic.api_key},
-    )
-    session_id = create_response.json()["session_id"]
-
-    # Send pain message
-    await client.post(
-        "/chat/message",
-        json={"session_id": session_id, "text": "I have severe toothache"},
-    )
-
-    # Stream first response
-    async with client.stream("GET", f"/chat/stream/{session_id}") as response:
-        combined1 = ""
-        async for chunk in response.aiter_text():
-            combined1 += chunk
-            if "complete" in chunk:
-                break
-
-    # Verify IntakeSpecialist is active
-    assert "intakespecialist" in combined1.lower()
-
-    # Send pain level response
-    await client.post(
-        "/chat/message",
-        json={"session_id": session_id, "text": "My pain level is 8"},
-    )
-
-    # Stream second response
-    async with client.stream("GET", f"/chat/stream/{session_id}") as response:
-        combined2 = ""
-        async for chunk in response.aiter_text():
-            combined2 += chunk
-            if "complete" in chunk:
-                break
-
-    # Verify asks about swelling
-    assert "swelling" in combined2.lower()
-
-
-@pytest.mark.asyncio
-async def test_intake_specialist_fever_check(client: AsyncClient, test_clinic):
-    """Test that IntakeSpecialist checks for fever red flag."""
-    # Create session
-    create_response = await client.post(
-        "/session",
-        json={"clinic_api_key": test_clinic.api_key},
-    )
-    session_id = create_response.json()["session_id"]
-
-    # Send pain message
-    await client.post(
-        "/chat/message",
-        json={"session_id": session_id, "text": "I have severe toothache"},
-    )
+    low = reply["text"].lower()
+    assert "pain" in low
+    assert_any_in(low, "1", "10", "scale")
 
-    # Stream first response and send pain level
-    async with client.stream("GET", f"/chat/stream/{session_id}") as response:
-        async for chunk in response.aiter_text():
-            if "complete" in chunk:
-                break
 
-    await client.post(
-        "/chat/message",
-        json={"session_id": session_id, "text": "My pain level is 8"},
-    )
-
-    # Stream second response and send swelling response
-    async with client.stream("GET", f"/chat/stream/{session_id}") as response:
-        async for chunk in response.aiter_text():
-            if "complete" in chunk:
-                break
-
-    await client.post(
-        "/chat/message",
-        json={"session_id": session_id, "text": "No swelling"},
-    )
-
-    # Stream third response
-    async with client.stream("GET", f"/chat/stream/{session_id}") as response:
-        combined = ""
-        async for chunk in response.aiter_text():
-            combined += chunk
-            if "complete" in chunk:
-                break
+async def chat_turns(client: AsyncClient, session_id: str, texts: list[str]) -> tuple[list[dict], str]:
+    """Send each message in turn, parsing every reply but the last.
 
-    # Verify asks about fever
-    assert "fever" in combined.lower()
-
-
-@pytest.mark.asyncio
-async def test_intake_specialist_priority_score(client: AsyncClient, test_clinic):
-    """Test that IntakeSpecialist outputs PRIORITY score after triage."""
-    # Create session
-    create_response = await client.post(
-        "/session",
-        json={"clinic_api_key": test_clinic.api_key},
-    )
-    session_id = create_response.json()["session_id"]
+    Args:
+        client: Test client
+        session_id: Session to converse in
+        texts: Patient messages, one per turn
 
-    # Send pain message
-    await client.post(
-        "/chat/message",
-        json={"session_id": session_id, "text": "I have severe toothache"},
-    )
+    Returns:
+        Parsed replies for all but the last turn and raw SSE data for the final turn
+    """
+    replies = [parse_reply(await chat_turn(client, session_id, text)) for text in texts[:-1]]
+    final = await chat_turn(client, session_id, texts[-1])
+    return replies, final
 
-    # Stream and send responses through triage flow
-    async with client.stream("GET", f"/chat/stream/{session_id}") as response:
-        async for chunk in response.aiter_text():
-            if "complete" in chunk:
-                break
 
-    await client.post(
-        "/chat/message",
-        json={"session_id": session_id, "text": "My pain level is 9"},
-    )
+# Pain level and swelling answer for each triage conversation, plus the text
+# the agent's swelling branch uses to acknowledge that answer
+TRIAGE_PATHS = {
+    "swelling": ("My pain level is 9", "Yes, I have swelling", "swelling can be a concern"),
+    "no_swelling": ("My pain level is 8", "No swelling", "okay, no swelling"),
+}
 
-    async with client.stream("GET", f"/chat/stream/{session_id}") as response:
-        async for chunk in response.aiter_text():
-            if "complete" in chunk:
-                break
 
-    await client.post(
-        "/chat/message",
-        json={"session_id": session_id, "text": "Yes, I have swelling"},
-    )
+@pytest.fixture(scope="class", params=TRIAGE_PATHS.values(), ids=TRIAGE_PATHS.keys())
+async def triage_replies(request, isolated_client, test_clinic) -> SimpleNamespace:
+    """Run one pain triage conversation per swelling answer and keep every agent reply.
 
-    async with client.stream("GET", f"/chat/stream/{session_id}") as response:
-        async for chunk in response.aiter_text():
-            if "complete" in chunk:
-                break
+    ``replies`` answer the opening toothache message, then the pain level and
+    swelling answers; ``final`` is the SSE data answering the fever answer.
+    ``swelling_ack`` is the text expected from the swelling branch taken.
+    """
+    pain_answer, swelling_answer, swelling_ack = request.param
+    async with isolated_client() as client:
+        create_response = await client.post(
+            "/session",
+            json={"clinic_api_key": test_clinic.api_key},
+        )
+        session_id = create_response.json()["session_id"]
+
+        replies, final = await chat_turns(
+            client,
+            session_id,
+            ["I have severe toothache", pain_answer, swelling_answer, "No fever"],
+        )
+    return SimpleNamespace(replies=replies, final=final, swelling_ack=swelling_ack)
+
+
+class TestIntakeTriage:
+    """IntakeSpecialist red-flag questions across a shared triage conversation.
+
+    Runs once with swelling and once without, covering both swelling branches.
+    """
 
-    await client.post(
-        "/chat/message",
-        json={"session_id": session_id, "text": "No fever"},
-    )
+    def test_swelling_check(self, triage_replies):
+        """Test that IntakeSpecialist checks for swelling red flag."""
+        replies = triage_replies.replies
+        # Verify IntakeSpecialist is active
+        assert replies[0]["active_agent"] == "IntakeSpecialist"
+        # Verify asks about swelling after the pain level
+        assert "swelling" in replies[1]["text"].lower()
 
-    # Stream final response
-    async with client.stream("GET", f"/chat/stream/{session_id}") as response:
-        combined = ""
-        async for chunk in response.aiter_text():
-            combined += chunk
-            if "complete" in chunk:
-                break
+    def test_fever_check(self, triage_replies):
+        """Test that IntakeSpecialist checks for fever red flag after either swelling answer."""
+        text = triage_replies.replies[2]["text"].lower()
+        assert triage_replies.swelling_ack in text
+        assert "fever" in text
 
-    # Extract text from SSE events for proper phrase matching
-    text_content = extract_text_from_sse(combined).lower()
+    def test_priority_score(self, triage_replies):
+        """Test that IntakeSpecialist outputs PRIORITY score after triage."""
+        # Extract text from SSE events for proper phrase matching
+        text_content = extract_text_from_sse(triage_replies.final).lower()
 
-    # Verify priority score is mentioned
-    assert "priority" in text_content or "urgent" in text_content
+        # Verify priority score is mentioned
+        assert_any_in(text_content, "priority", "urgent")
 
 
 @pytest.mark.asyncio
@@ -429,21 +346,14 @@ async def test_intake_specialist_empathetic_flow(client: AsyncClient, test_clini
         json={"session_id": session_id, "text": "I'm in terrible pain, please help me"},
     )
 
-    # Stream response
-    async with client.stream("GET", f"/chat/stream/{session_id}") as response:
-        combined = ""
-        async for chunk in response.aiter_text():
-            combined += chunk
-            if "complete" in chunk:
-                break
-
-    # Extract text from SSE events for proper phrase matching
-    text_content = extract_text_from_sse(combined).lower()
+    # Fetch response
+    reply = await get_reply(client, session_id)
+    text_content = reply["text"].lower()
 
     # Verify empathetic language
-    assert "understand" in text_content or "help" in text_content
+    assert_any_in(text_content, "understand", "help")
     # Verify supportive (not clinical/dismissive) language
-    assert "sorry" in text_content or "i understand" in text_content
+    assert_any_in(text_content, "sorry", "i understand")
 
 
 @pytest.mark.asyncio
@@ -462,19 +372,12 @@ async def test_intake_specialist_emergency_breathing_difficulty(client: AsyncCli
         json={"session_id": session_id, "text": "I have severe toothache and difficulty breathing"},
     )
 
-    # Stream response
-    async with client.stream("GET", f"/chat/stream/{session_id}") as response:
-        combined = ""
-        async for chunk in response.aiter_text():
-            combined += chunk
-            if "complete" in chunk:
-                break
-
-    # Extract text from SSE events for proper phrase matching
-    text_content = extract_text_from_sse(combined).lower()
+    # Fetch response
+    reply = await get_reply(client, session_id)
+    text_content = reply["text"].lower()
 
     # Verify emergency recognition
-    assert "emergency" in text_content or "immediate" in text_content or "urgent" in text_content
+    assert_any_in(text_content, "emergency", "immediate", "urgent")
 
 
 @pytest.mark.asyncio
@@ -490,16 +393,12 @@ async def test_stream_chat_sends_ui_component_for_pain(client: AsyncClient, test
     # Send pain message
     await client.post(
         "/chat/message",
-        json={"session_id": session_id, "text": "I have severe toothache"},
+        json={"session_id": session_id, **TOOTHACHE},
     )
 
     # Stream and check for UI component
     async with client.stream("GET", f"/chat/stream/{session_id}") as response:
-        combined = ""
-        async for chunk in response.aiter_text():
-            combined += chunk
-            if "complete" in chunk:
-                break
+        combined = await read_sse(response, "painscaleselector")
 
     # Verify UI component event is present
     assert "ui_component" in combined
@@ -519,16 +418,12 @@ async def test_stream_chat_sends_ui_component_for_booking(client: AsyncClient, t
     # Send booking message
     await client.post(
         "/chat/message",
-        json={"session_id": session_id, "text": "I want to book an appointment"},
+        json={"session_id": session_id, **BOOKING},
     )
 
     # Stream and check for UI component
     async with client.stream("GET", f"/chat/stream/{session_id}") as response:
-        combined = ""
-        async for chunk in response.aiter_text():
-            combined += chunk
-            if "complete" in chunk:
-                break
+        combined = await read_sse(response, "datetimepicker")
 
     # Verify UI component event is present
     assert "ui_component" in combined
@@ -548,16 +443,12 @@ async def test_stream_chat_sends_previous_agent_on_handoff(client: AsyncClient,
     # Send pain message to trigger hand-off from Receptionist to IntakeSpecialist
     await client.post(
         "/chat/message",
-        json={"session_id": session_id, "text": "I have severe toothache"},
+        json={"session_id": session_id, **TOOTHACHE},
     )
 
     # Stream and check for previous_agent
     async with client.stream("GET", f"/chat/stream/{session_id}") as response:
-        combined = ""
-        async for chunk in response.aiter_text():
-            combined += chunk
-            if "complete" in chunk:
-                break
+        combined = await read_sse(response)
 
     # Verify agent_state event includes previous_agent
     assert "agent_state" in combined
@@ -579,24 +470,18 @@ async def test_stream_chat_no_previous_agent_on_same_agent(client: AsyncClient,
     # Send greeting message (stays with Receptionist)
     await client.post(
         "/chat/message",
-        json={"session_id": session_id, "text": "Hello"},
+        json={"session_id": session_id, **HELLO},
     )
 
     # Stream response
     async with client.stream("GET", f"/chat/stream/{session_id}") as response:
-        combined = ""
-        async for chunk in response.aiter_text():
-            combined += chunk
-            if "complete" in chunk:
-                break
+        combined = await read_sse(response)
 
     # Verify agent_state event does NOT include previous_agent (no hand-off)
     assert "agent_state" in combined
     # Check that previous_agent is NOT in the agent_state event
     # Extract agent_state data
-    import re
     agent_state_match = re.search(r'agent_state\\ndata: ({[^}]+})', combined)
     if agent_state_match:
-        import json
         data = json.loads(agent_state_match.group(1))
         assert "previous_agent" not in data
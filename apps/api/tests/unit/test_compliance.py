@@ -1,8 +1,6 @@
 """Unit tests for AHPRA compliance filtering."""
 
 import pytest
-from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.compliance import (
     filter_compliance,
@@ -10,6 +8,9 @@ from src.core.compliance import (
     validate_feedback_content,
     AHPRAComplianceError,
 )
+from src.routes import chat
+from tests.factories import make_session
+from tests.sse import parse_reply
 
 
 class TestComplianceFilter:
@@ -77,108 +78,69 @@ class TestComplianceFilter:
 
 
 class TestComplianceIntegration:
-    """Test compliance integration with chat API."""
+    """Test compliance integration with the chat agent turn."""
 
-    @pytest.mark.asyncio
-    async def test_chat_response_is_compliant(self, client: AsyncClient, test_clinic):
-        """Test that chat responses are filtered for compliance."""
-        # Create session
-        create_response = await client.post(
-            "/session",
-            json={"clinic_api_key": test_clinic.api_key},
+    async def run_turn(self, async_session, test_clinic, text):
+        """Store one user message and collect the streamed reply to it in-process."""
+        session = make_session(
+            clinic_id=test_clinic.id,
+            messages=[{"role": "user", "content": text}],
         )
-        session_id = create_response.json()["session_id"]
+        async_session.add(session)
+        await async_session.commit()
+        frames = [frame async for frame in chat.generate_sse_events(async_session, session.session_id)]
+        return parse_reply("".join(frames))
 
-        # Send a message
-        await client.post(
-            "/chat/message",
-            json={"session_id": session_id, "text": "Hello"},
-        )
-
-        # Stream response
-        async with client.stream("GET", f"/chat/stream/{session_id}") as response:
-            combined = ""
-            async for chunk in response.aiter_text():
-                combined += chunk
-                if "complete" in chunk:
-                    break
+    @pytest.mark.asyncio
+    async def test_chat_response_is_compliant(self, async_session, test_clinic):
+        """Test that chat responses are filtered for compliance."""
+        turn = await self.run_turn(async_session, test_clinic, "Hello")
 
         # Verify response doesn't contain prohibited patterns
         # (The default greeting should be compliant)
-        assert "best" not in combined.lower() or "experienced" in combined.lower()
-        assert "guarantee" not in combined.lower()
+        low = turn["text"].lower()
+        assert "best" not in low or "experienced" in low
+        assert "guarantee" not in low
 
     @pytest.mark.asyncio
-    async def test_chat_filters_violations_in_responses(self, client: AsyncClient, test_clinic, monkeypatch):
+    async def test_chat_filters_violations_in_responses(self, async_session, test_clinic, monkeypatch):
         """Test that violations in responses are filtered."""
-        # Create session
-        create_response = await client.post(
-            "/session",
-            json={"clinic_api_key": test_clinic.api_key},
+        # The keyword routing never produces a violation, so prepend one
+        # ahead of the real filter to prove the reply passes through it
+        monkeypatch.setattr(
+            chat,
+            "sanitize_agent_response",
+            lambda text: sanitize_agent_response("We are the best dentist, guaranteed painless! " + text),
         )
-        session_id = create_response.json()["session_id"]
-
-        # Note: We can't easily inject non-compliant responses in the current
-        # keyword-based routing, but we've verified the filter is applied.
-        # This test documents the expected behavior.
 
-        # Send a message
-        await client.post(
-            "/chat/message",
-            json={"session_id": session_id, "text": "I have a toothache"},
-        )
+        turn = await self.run_turn(async_session, test_clinic, "I have a toothache")
 
-        # Stream response
-        async with client.stream("GET", f"/chat/stream/{session_id}") as response:
-            combined = ""
-            async for chunk in response.aiter_text():
-                combined += chunk
-                if "complete" in chunk:
-                    break
-
-        # Response should be compliant
-        # (Current responses are already compliant, but filter is in place)
-        assert "best" not in combined.lower() or "experienced" in combined.lower()
+        low = turn["text"].lower()
+        assert "best" not in low
+        assert "guaranteed" not in low
+        assert "painless" not in low
+        assert "pain level" in low
 
 
 class TestCompliancePatterns:
     """Test specific AHPRA prohibited patterns."""
 
-    def test_pattern_best_dentist(self):
-        """Test 'best dentist' pattern."""
-        text = "We are the best dentist in Sydney"
-        filtered, violations = filter_compliance(text, strict=False)
-        assert any('TESTIMONIAL' in v for v in violations)
-
-    def test_pattern_most_trusted(self):
-        """Test 'most trusted' pattern."""
-        text = "Our clinic is the most trusted"
-        filtered, violations = filter_compliance(text, strict=False)
-        assert any('TESTIMONIAL' in v for v in violations)
-
-    def test_pattern_better_than(self):
-        """Test 'better than' pattern."""
-        text = "Our care is better than other clinics"
-        filtered, violations = filter_compliance(text, strict=False)
-        assert any('COMPARATIVE' in v for v in violations)
-
-    def test_pattern_guaranteed(self):
-        """Test 'guaranteed' pattern."""
-        text = "Guaranteed painless procedure"
-        filtered, violations = filter_compliance(text, strict=False)
-        assert any('GUARANTEE' in v for v in violations)
-
-    def test_pattern_painless(self):
-        """Test 'painless' pattern."""
-        text = "We provide painless treatment"
-        filtered, violations = filter_compliance(text, strict=False)
-        assert any('GUARANTEE' in v for v in violations)
-
-    def test_pattern_100_percent(self):
-        """Test '100%' pattern."""
-        text = "100% success rate"
+    @pytest.mark.parametrize(
+        "text,violation_type",
+        [
+            ("We are the best dentist in Sydney", "TESTIMONIAL"),
+            ("Our clinic is the most trusted", "TESTIMONIAL"),
+            ("Our care is better than other clinics", "COMPARATIVE"),
+            ("Guaranteed painless procedure", "GUARANTEE"),
+            ("We provide painless treatment", "GUARANTEE"),
+            ("100% success rate", "GUARANTEE"),
+        ],
+        ids=["best_dentist", "most_trusted", "better_than", "guaranteed", "painless", "100_percent"],
+    )
+    def test_pattern(self, text, violation_type):
+        """Test each prohibited pattern is flagged with its violation type."""
         filtered, violations = filter_compliance(text, strict=False)
-        assert any('GUARANTEE' in v for v in violations)
+        assert any(violation_type in v for v in violations)
 
     def test_allowed_terms_pass_through(self):
         """Test that allowed informational terms are preserved."""
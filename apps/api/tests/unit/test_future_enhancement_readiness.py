@@ -3,101 +3,87 @@ Test future enhancement readiness.
 These tests verify the system is ready for future enhancements without requiring them to be implemented.
 """
 
-import os
 import pytest
 from pathlib import Path
 
+from tests.paths import API_DIR, path_exists
 
+
+# Extension points each future feature builds on
+EXTENSION_POINT_PATHS = {
+    "models_dir": "src/models/",
+    "base_models": "src/models/session.py",
+    "routes_dir": "src/routes/",
+    "main_api": "src/main.py",
+    "services_dir": "src/services/",
+    "unit_tests_dir": "tests/unit/",
+    "tests_dir": "tests/",
+    "compliance_framework": "src/core/compliance.py",
+    "configuration": "src/core/config.py",
+}
+
+# Source packages new features plug into
+REQUIRED_SOURCE_DIRS = ("src/models", "src/routes", "src/services", "src/tools", "src/agents")
+
+
+@pytest.mark.smoke
 class TestFutureEnhancementReadiness:
     """Test that the system is ready for future enhancements."""
 
-    def test_database_ready_for_extensions(self):
-        """Verify database models are extensible for future features."""
-        models_path = Path("src/models/")
-        assert models_path.exists(), "Models directory should exist for extensibility"
-        assert Path("src/models/session.py").exists(), "Base models should exist"
-
-    def test_api_ready_for_extensions(self):
-        """Verify API structure supports future endpoint extensions."""
-        routes_path = Path("src/routes/")
-        assert routes_path.exists(), "Routes directory should exist for extensibility"
-        assert Path("src/main.py").exists(), "Main API file should exist"
-
-    def test_services_ready_for_extensions(self):
-        """Verify services structure supports future service extensions."""
-        services_path = Path("src/services/")
-        assert services_path.exists(), "Services directory should exist for extensibility"
-
-    def test_testing_infrastructure_ready(self):
-        """Verify testing infrastructure supports future feature tests."""
-        tests_path = Path("tests/unit/")
-        assert tests_path.exists(), "Unit tests directory should exist"
-        tests_path = Path("tests/")
-        assert tests_path.exists(), "Tests directory should exist"
-
-    def test_compliance_framework_ready(self):
-        """Verify compliance framework can be extended for future features."""
-        compliance_path = Path("src/core/compliance.py")
-        assert compliance_path.exists(), "Compliance framework should exist"
-
-    def test_configuration_ready_for_extensions(self):
-        """Verify configuration system supports future feature configuration."""
-        config_path = Path("src/core/config.py")
-        assert config_path.exists(), "Configuration system should exist"
+    @pytest.mark.parametrize("path", EXTENSION_POINT_PATHS.values(), ids=EXTENSION_POINT_PATHS.keys())
+    def test_extension_point_exists(self, path):
+        """Verify each extension point for future features exists."""
+        assert path_exists(path), f"{path} should exist for extensibility"
 
 
+@pytest.mark.smoke
 class TestSMSReadiness:
     """Test readiness for SMS notification feature."""
 
     def test_sms_framework_ready(self):
         """Verify system is ready for SMS integration."""
         # Check that the basic infrastructure exists
-        assert Path("src/services/").exists(), "Services directory should exist for SMS service"
-        assert Path("src/routes/").exists(), "Routes directory should exist for SMS endpoints"
-        assert Path("src/core/config.py").exists(), "Configuration should support SMS settings"
+        assert path_exists("src/services/"), "Services directory should exist for SMS service"
+        assert path_exists("src/routes/"), "Routes directory should exist for SMS endpoints"
+        assert path_exists("src/core/config.py"), "Configuration should support SMS settings"
 
 
+@pytest.mark.smoke
 class TestWaitlistReadiness:
     """Test readiness for waitlist management feature."""
 
     def test_waitlist_framework_ready(self):
         """Verify system is ready for waitlist management."""
         # Check that the basic infrastructure exists
-        assert Path("src/models/session.py").exists(), "Models should support waitlist extensions"
-        assert Path("src/routes/").exists(), "Routes directory should exist for waitlist endpoints"
-        assert Path("src/services/").exists(), "Services directory should exist for waitlist service"
+        assert path_exists("src/models/session.py"), "Models should support waitlist extensions"
+        assert path_exists("src/routes/"), "Routes directory should exist for waitlist endpoints"
+        assert path_exists("src/services/"), "Services directory should exist for waitlist service"
 
 
 class TestFutureFeatureIntegration:
     """Test that future features can be integrated seamlessly."""
 
+    @pytest.mark.smoke
     def test_modular_architecture(self):
         """Verify the system uses modular architecture for easy extension."""
         # Check that key directories exist for modular extension
-        required_dirs = [
-            "src/models",
-            "src/routes",
-            "src/services",
-            "src/tools",
-            "src/agents"
-        ]
-
-        for dir_path in required_dirs:
-            assert Path(dir_path).exists(), f"Required directory {dir_path} should exist"
+        missing = [path for path in REQUIRED_SOURCE_DIRS if not path_exists(path)]
+        assert not missing, f"Required directories should exist: {missing}"
 
     def test_api_structure_supports_extensions(self):
         """Verify API structure supports adding new endpoints."""
-        main_api = Path("src/main.py")
-        assert main_api.exists(), "Main API file should exist for adding new routes"
+        main_api = API_DIR / "src/main.py"
+        assert path_exists(main_api), "Main API file should exist for adding new routes"
 
         # Check that the main API imports routers
         content = main_api.read_text()
         assert "include_router" in content, "API should support router inclusion"
 
+    @pytest.mark.smoke
     def test_database_schema_supports_extensions(self):
         """Verify database schema can be extended for new features."""
         models_dir = Path("src/models/")
-        assert models_dir.exists(), "Models directory should exist for schema extensions"
+        assert path_exists(models_dir), "Models directory should exist for schema extensions"
 
 
 if __name__ == "__main__":
@@ -3,45 +3,84 @@ Test future enhancement features.
 These tests verify the infrastructure needed for SMS notifications and waitlist management.
 """
 
-import os
+import re
 import pytest
-from pathlib import Path
+
+import src.models as models
+from src.core.database import Base
+from tests.paths import API_DIR
+
+# Files SMS notifications and waitlist management are built from, with the
+# tests covering them
+REQUIRED_PATHS = (
+    # SMS notifications
+    "src/services/sms_service.py",
+    "src/routes/notifications.py",
+    "src/services/notification_scheduler.py",
+    # Waitlist management
+    "src/models/waitlist.py",
+    "src/routes/waitlist.py",
+    "src/services/waitlist_service.py",
+    "src/services/waitlist_notifications.py",
+    # API extension point
+    "src/routes",
+    "src/routes/__init__.py",
+    # Test infrastructure
+    "tests/unit/test_sms_service.py",
+    "tests/unit/test_notifications.py",
+    "tests/unit/test_waitlist_service.py",
+    "tests/unit/test_waitlist_notifications.py",
+    "tests/integration",
+    "tests/integration/test_sms_integration.py",
+    "tests/integration/test_waitlist_integration.py",
+)
+
+# Text the tests below look for in each inspected source file
+SOURCE_NEEDLES = {
+    "src/services/sms_service.py": ("send_appointment_reminder", "send_confirmation"),
+    "src/routes/notifications.py": ("POST /notifications/send", "GET /notifications/status"),
+}
+SOURCE_PATTERNS = {
+    path: re.compile("|".join(map(re.escape, needles))) for path, needles in SOURCE_NEEDLES.items()
+}
+
+
+@pytest.fixture(scope="module")
+def source_needles(existing_paths) -> dict[str, frozenset[str]]:
+    """Read each inspected source file once and find all its needles in one regex pass.
+
+    Missing files map to an empty set.
+    """
+    found = {}
+    for path, pattern in SOURCE_PATTERNS.items():
+        text = (API_DIR / path).read_bytes().decode() if path in existing_paths else ""
+        found[path] = frozenset(pattern.findall(text))
+    return found
+
+
+@pytest.mark.smoke
+@pytest.mark.parametrize("path", REQUIRED_PATHS)
+def test_required_file_exists(path, existing_paths):
+    """Verify each file future enhancements rely on is in place."""
+    assert path in existing_paths, f"{path} should exist"
 
 
 class TestSMSNotifications:
     """Test SMS notification infrastructure."""
 
-    def test_sms_notification_infrastructure_exists(self):
-        """Verify SMS notification infrastructure is in place."""
-        # This would test actual SMS integration
-        # For now, verify the infrastructure files exist
-        assert Path("src/services/sms_service.py").exists(), "SMS service should exist"
-        assert Path("src/routes/notifications.py").exists(), "Notification endpoints should exist"
-
-    def test_sms_service_configured(self):
+    def test_sms_service_configured(self, source_needles):
         """Verify SMS service is properly configured."""
-        # Verify SMS service configuration
-        sms_service_path = Path("src/services/sms_service.py")
-        if sms_service_path.exists():
-            content = sms_service_path.read_text()
-            # Verify required SMS functionality exists
-            assert "send_appointment_reminder" in content, "SMS service should have reminder function"
-            assert "send_confirmation" in content, "SMS service should have confirmation function"
-
-    def test_notification_endpoints_configured(self):
-        """Verify notification API endpoints are configured."""
-        notifications_path = Path("src/routes/notifications.py")
-        if notifications_path.exists():
-            content = notifications_path.read_text()
-            # Verify required notification endpoints exist
-            assert "POST /notifications/send" in content, "Send notification endpoint should exist"
-            assert "GET /notifications/status" in content, "Notification status endpoint should exist"
+        found = source_needles["src/services/sms_service.py"]
+        # Verify required SMS functionality exists
+        assert "send_appointment_reminder" in found, "SMS service should have reminder function"
+        assert "send_confirmation" in found, "SMS service should have confirmation function"
 
-    def test_appointment_reminder_logic_exists(self):
-        """Verify appointment reminder logic is implemented."""
-        # This would test actual reminder scheduling
-        # For now, verify the logic files exist
-        assert Path("src/services/notification_scheduler.py").exists(), "Notification scheduler should exist"
+    def test_notification_endpoints_configured(self, source_needles):
+        """Verify notification API endpoints are configured."""
+        found = source_needles["src/routes/notifications.py"]
+        # Verify required notification endpoints exist
+        assert "POST /notifications/send" in found, "Send notification endpoint should exist"
+        assert "GET /notifications/status" in found, "Notification status endpoint should exist"
 
 
 class TestWaitlistManagement:
@@ -49,93 +88,12 @@ class TestWaitlistManagement:
 
     def test_waitlist_database_model_exists(self):
         """Verify waitlist database model is implemented."""
-        models_path = Path("src/models/waitlist.py")
-        if models_path.exists():
-            content = models_path.read_text()
-            # Verify Waitlist model exists
-            assert "Waitlist" in content, "Waitlist model should be defined"
-
-    def test_waitlist_endpoints_configured(self):
-        """Verify waitlist API endpoints are configured."""
-        # This would typically test actual API endpoints
-        # For now, verify the endpoint files exist
-        assert Path("src/routes/waitlist.py").exists(), "Waitlist endpoints should exist"
-
-    def test_waitlist_service_implemented(self):
-        """Verify waitlist service is implemented."""
-        # This would test actual waitlist functionality
-        # For now, verify the service files exist
-        assert Path("src/services/waitlist_service.py").exists(), "Waitlist service should exist"
-
-    def test_waitlist_notification_logic_exists(self):
-        """Verify waitlist notification logic is implemented."""
-        # This would test actual notification logic
-        # For now, verify the logic files exist
-        assert Path("src/services/waitlist_notifications.py").exists(), "Waitlist notifications should exist"
-
-
-class TestFutureEnhancementsIntegration:
-    """Test integration readiness for future enhancements."""
-
-    def test_sms_integration_readiness(self):
-        """Verify system is ready for SMS integration."""
-        required_files = [
-            "src/services/sms_service.py",
-            "src/routes/notifications.py",
-            "src/services/notification_scheduler.py"
-        ]
-
-        for file_path in required_files:
-            assert Path(file_path).exists(), f"Required SMS file {file_path} should exist"
-
-    def test_waitlist_integration_readiness(self):
-        """Verify system is ready for waitlist management."""
-        required_files = [
-            "src/models/waitlist.py",  # Contains Waitlist model
-            "src/routes/waitlist.py",
-            "src/services/waitlist_service.py",
-            "src/services/waitlist_notifications.py"
-        ]
-
-        for file_path in required_files:
-            assert Path(file_path).exists(), f"Required waitlist file {file_path} should exist"
+        assert hasattr(models, "Waitlist"), "Waitlist model should be defined"
 
     def test_database_extensions_ready(self):
         """Verify database is ready for future table extensions."""
-        models_path = Path("src/models/waitlist.py")
-        if models_path.exists():
-            content = models_path.read_text()
-            # Verify models are extensible
-            assert "Base" in content, "Models should use SQLAlchemy Base for extensibility"
-
-    def test_api_extensions_ready(self):
-        """Verify API is ready for future endpoint extensions."""
-        # Verify API structure supports extensions
-        assert Path("src/routes/").exists(), "API routes directory should exist"
-        assert Path("src/routes/__init__.py").exists(), "API routes should be properly structured"
-
-
-class TestFutureEnhancementTests:
-    """Test that test infrastructure supports future enhancements."""
-
-    def test_sms_test_infrastructure_exists(self):
-        """Verify SMS testing infrastructure is in place."""
-        # Verify test files exist for SMS functionality
-        assert Path("tests/unit/test_sms_service.py").exists(), "SMS service tests should exist"
-        assert Path("tests/unit/test_notifications.py").exists(), "Notification tests should exist"
-
-    def test_waitlist_test_infrastructure_exists(self):
-        """Verify waitlist testing infrastructure is in place."""
-        # Verify test files exist for waitlist functionality
-        assert Path("tests/unit/test_waitlist_service.py").exists(), "Waitlist service tests should exist"
-        assert Path("tests/unit/test_waitlist_notifications.py").exists(), "Waitlist notification tests should exist"
-
-    def test_integration_test_infrastructure_exists(self):
-        """Verify integration testing infrastructure supports future features."""
-        # Verify integration test structure exists
-        assert Path("tests/integration/").exists(), "Integration tests directory should exist"
-        assert Path("tests/integration/test_sms_integration.py").exists(), "SMS integration tests should exist"
-        assert Path("tests/integration/test_waitlist_integration.py").exists(), "Waitlist integration tests should exist"
+        # Verify models are extensible
+        assert issubclass(models.Waitlist, Base), "Models should use SQLAlchemy Base for extensibility"
 
 
 if __name__ == "__main__":
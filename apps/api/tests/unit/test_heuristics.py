@@ -2,101 +2,102 @@
 
 import pytest
 from datetime import datetime, timedelta
+from fastapi import HTTPException
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, insert
+from types import SimpleNamespace
 from uuid import uuid4
 
-
-@pytest.mark.asyncio
-async def test_calculate_move_score_high_value(client: AsyncClient, async_session: AsyncSession):
-    """Test calculating move score for a high-value procedure."""
-    from src.models import Clinic, Dentist, Patient, Appointment, AppointmentStatus, Procedure
-
-    # Create entities
-    clinic = Clinic(id=uuid4(), name="Test Clinic", api_key="test_key", timezone="Australia/Sydney", settings={})
-    dentist = Dentist(id=uuid4(), clinic_id=clinic.id, name="Dr. Test", is_active=True, specializations=["general"], schedule={})
-    patient = Patient(id=uuid4(), phone="+61412345678", name="John Doe", ltv_score=500.0)
-    async_session.add_all([clinic, dentist, patient])
-    await async_session.commit()
-
-    # Create existing appointment (low value)
-    start_time = datetime.now() + timedelta(days=7)
-    appointment = Appointment(
-        id=uuid4(),
-        patient_id=patient.id,
-        clinic_id=clinic.id,
-        dentist_id=dentist.id,
-        start_time=start_time,
-        duration_mins=30,
-        procedure_code="D1110",
-        procedure_name="Prophylaxis",
-        estimated_value=150.0,
-        status=AppointmentStatus.BOOKED,
-    )
-    async_session.add(appointment)
-    await async_session.commit()
-
-    # Calculate move score for high-value procedure
-    response = await client.post(
-        "/heuristics/move-score",
-        json={
-            "appointment_id": str(appointment.id),
-            "candidate_slot": "some-slot",
-            "new_procedure_value": 1200.0,  # Crown
-        },
-    )
-
-    assert response.status_code == 200
-    data = response.json()
-    assert "move_score" in data
-    assert "recommendation" in data
-    assert "incentive_needed" in data
-    assert data["move_score"] > 70  # Should recommend move for high value
-    assert data["recommendation"] == "MOVE"
+from src.models import Clinic, Dentist, Patient
+from src.routes.heuristics import MoveScoreRequest, calculate_move_score
+from tests.factories import (
+    clinic_values,
+    dentist_values,
+    make_appointment,
+    make_clinic,
+    make_procedure,
+    patient_values,
+)
+
+
+@pytest.fixture(scope="module")
+async def base_entities(async_engine):
+    """Insert the clinic, dentist and patient the heuristics tests share, once per module.
+
+    The rows are committed outside the per-test SAVEPOINT, so each test's own
+    appointments still roll back, and they are deleted when the module ends.
+    """
+    clinic = clinic_values(api_key="heuristics_test_key")
+    dentist = dentist_values(clinic_id=clinic["id"])
+    patient = patient_values(phone="+61400000101", ltv_score=500.0)
+    async with async_engine.begin() as conn:
+        await conn.execute(insert(Clinic).values(clinic))
+        await conn.execute(insert(Dentist).values(dentist))
+        await conn.execute(insert(Patient).values(patient))
+
+    yield SimpleNamespace(clinic_id=clinic["id"], dentist_id=dentist["id"], patient_id=patient["id"])
+
+    async with async_engine.begin() as conn:
+        await conn.execute(delete(Patient).where(Patient.id == patient["id"]))
+        await conn.execute(delete(Dentist).where(Dentist.id == dentist["id"]))
+        await conn.execute(delete(Clinic).where(Clinic.id == clinic["id"]))
 
 
 @pytest.mark.asyncio
-async def test_calculate_move_score_low_value(client: AsyncClient, async_session: AsyncSession):
-    """Test calculating move score for a low-value procedure."""
-    from src.models import Clinic, Dentist, Patient, Appointment, AppointmentStatus
-
-    # Create entities
-    clinic = Clinic(id=uuid4(), name="Test Clinic", api_key="test_key", timezone="Australia/Sydney", settings={})
-    dentist = Dentist(id=uuid4(), clinic_id=clinic.id, name="Dr. Test", is_active=True, specializations=["general"], schedule={})
-    patient = Patient(id=uuid4(), phone="+61412345678", name="John Doe", ltv_score=500.0)
-    async_session.add_all([clinic, dentist, patient])
-    await async_session.commit()
-
-    # Create existing appointment (high value)
-    start_time = datetime.now() + timedelta(days=7)
-    appointment = Appointment(
-        id=uuid4(),
-        patient_id=patient.id,
-        clinic_id=clinic.id,
-        dentist_id=dentist.id,
-        start_time=start_time,
-        duration_mins=60,
-        procedure_code="D2710",
-        procedure_name="Crown",
-        estimated_value=1200.0,
-        status=AppointmentStatus.BOOKED,
+@pytest.mark.parametrize(
+    "existing, new_procedure_value, expected",
+    [
+        # Booked cleaning (the factory default), candidate crown: worth moving
+        ({}, 1200.0, "MOVE"),
+        # Booked crown, candidate cleaning: keep it
+        (
+            {
+                "duration_mins": 60,
+                "procedure_code": "D2710",
+                "procedure_name": "Crown",
+                "estimated_value": 1200.0,
+            },
+            150.0,
+            "KEEP",
+        ),
+    ],
+    ids=["high_value", "low_value"],
+)
+async def test_calculate_move_score(
+    client: AsyncClient,
+    async_session: AsyncSession,
+    base_entities,
+    existing,
+    new_procedure_value,
+    expected,
+):
+    """Test the move score recommendation for a higher- or lower-value candidate procedure."""
+    appointment = make_appointment(
+        patient_id=base_entities.patient_id,
+        clinic_id=base_entities.clinic_id,
+        dentist_id=base_entities.dentist_id,
+        start_time=datetime.now() + timedelta(days=7),
+        **existing,
     )
     async_session.add(appointment)
-    await async_session.commit()
+    await async_session.flush()
 
-    # Calculate move score for low-value procedure
     response = await client.post(
         "/heuristics/move-score",
         json={
             "appointment_id": str(appointment.id),
             "candidate_slot": "some-slot",
-            "new_procedure_value": 150.0,  # Cleaning
+            "new_procedure_value": new_procedure_value,
         },
     )
 
     assert response.status_code == 200
     data = response.json()
-    assert data["recommendation"] == "KEEP"
+    assert {"move_score", "recommendation", "incentive_needed"} <= data.keys()
+    assert data["recommendation"] == expected
+    if expected == "MOVE":
+        assert data["move_score"] > 70
 
 
 @pytest.mark.asyncio
@@ -116,66 +117,48 @@ async def test_calculate_move_score_invalid_appointment(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_calculate_move_score_invalid_format(client: AsyncClient):
+async def test_calculate_move_score_invalid_format():
     """Test calculating move score with invalid appointment_id format."""
-    response = await client.post(
-        "/heuristics/move-score",
-        json={
-            "appointment_id": "not-a-uuid",
-            "candidate_slot": "some-slot",
-            "new_procedure_value": 1000.0,
-        },
+    # The id is rejected before the handler touches the database, so call it directly
+    request = MoveScoreRequest(
+        appointment_id="not-a-uuid",
+        candidate_slot="some-slot",
+        new_procedure_value=1000.0,
     )
+    with pytest.raises(HTTPException) as exc_info:
+        await calculate_move_score(request, db=None)
 
-    assert response.status_code == 400
+    assert exc_info.value.status_code == 400
 
 
 @pytest.mark.asyncio
-async def test_optimize_day_with_suggestions(client: AsyncClient, async_session: AsyncSession):
+async def test_optimize_day_with_suggestions(client: AsyncClient, async_session: AsyncSession, base_entities):
     """Test day optimization returns suggestions for high-value procedures."""
-    from src.models import Clinic, Dentist, Patient, Appointment, AppointmentStatus, Procedure
-
-    # Create entities
-    clinic = Clinic(id=uuid4(), name="Test Clinic", api_key="test_key", timezone="Australia/Sydney", settings={})
-    dentist = Dentist(id=uuid4(), clinic_id=clinic.id, name="Dr. Test", is_active=True, specializations=["general"], schedule={})
-    patient = Patient(id=uuid4(), phone="+61412345678", name="John Doe", ltv_score=100.0)
 
     # Create procedures
-    cleaning = Procedure(
-        id=uuid4(), code="D1110", name="Prophylaxis", category="Preventive",
-        default_duration_mins=30, base_value=150.0, priority_weight=0.3
-    )
-    crown = Procedure(
-        id=uuid4(), code="D2710", name="Crown", category="Restorative",
-        default_duration_mins=90, base_value=1200.0, priority_weight=0.8
+    cleaning = make_procedure()
+    crown = make_procedure(
+        code="D2710", name="Crown", category="Restorative",
+        default_duration_mins=90, base_value=1200.0, priority_weight=0.8,
     )
 
-    async_session.add_all([clinic, dentist, patient, cleaning, crown])
-    await async_session.commit()
-
-    # Create existing low-value appointment
+    # Create existing low-value appointment (the factory default cleaning)
     test_date = datetime.now().date() + timedelta(days=7)
     start_time = datetime.combine(test_date, datetime.min.time()).replace(hour=10)
-    appointment = Appointment(
-        id=uuid4(),
-        patient_id=patient.id,
-        clinic_id=clinic.id,
-        dentist_id=dentist.id,
+    appointment = make_appointment(
+        patient_id=base_entities.patient_id,
+        clinic_id=base_entities.clinic_id,
+        dentist_id=base_entities.dentist_id,
         start_time=start_time,
-        duration_mins=30,
-        procedure_code="D1110",
-        procedure_name="Prophylaxis",
-        estimated_value=150.0,
-        status=AppointmentStatus.BOOKED,
     )
-    async_session.add(appointment)
-    await async_session.commit()
+    async_session.add_all([cleaning, crown, appointment])
+    await async_session.flush()
 
     # Optimize day
     response = await client.post(
         "/heuristics/optimize-day",
         json={
-            "clinic_id": str(clinic.id),
+            "clinic_id": str(base_entities.clinic_id),
             "date": test_date.isoformat(),
         },
     )
@@ -189,11 +172,10 @@ async def test_optimize_day_with_suggestions(client: AsyncClient, async_session:
 @pytest.mark.asyncio
 async def test_optimize_day_no_appointments(client: AsyncClient, async_session: AsyncSession):
     """Test day optimization with no appointments."""
-    from src.models import Clinic
 
-    clinic = Clinic(id=uuid4(), name="Test Clinic", api_key="test_key", timezone="Australia/Sydney", settings={})
+    clinic = make_clinic()
     async_session.add(clinic)
-    await async_session.commit()
+    await async_session.flush()
 
     test_date = datetime.now().date() + timedelta(days=7)
     response = await client.post(
@@ -0,0 +1,24 @@
+"""Unknown-resource tests shared by the session and patients endpoints."""
+
+import uuid
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("method", "url", "body"),
+    [
+        ("GET", "/patients/lookup?phone=%2B61999999999", None),
+        ("PUT", f"/patients/{uuid.uuid4()}", {"ltv_score": 500.0}),
+        ("GET", f"/session/{uuid.uuid4()}", None),
+    ],
+    ids=["lookup_patient", "update_patient", "get_session"],
+)
+async def test_unknown_resource_returns_404(client: AsyncClient, method, url, body):
+    """Test requesting a non-existent patient or session returns 404."""
+    response = await client.request(method, url, json=body)
+
+    assert response.status_code == 404
+    assert "not found" in response.json()["detail"].lower()
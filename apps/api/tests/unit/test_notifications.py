@@ -1,82 +1,116 @@
 """Test notification API endpoints."""
 
+from unittest.mock import create_autospec
+
 import pytest
+from fastapi import BackgroundTasks, HTTPException
 from fastapi.testclient import TestClient
-from src.main import app
+from src.routes import notifications
+from src.routes.notifications import NotificationRequest, send_notification
+from src.services.sms_service import SMSService
+from tests.payloads import JSON_HEADERS, json_dumps
+
+
+# Request bodies, serialized once at import and sent as raw content
+REMINDER = json_dumps({
+    "phone": "+61400000000",
+    "type": "reminder",
+    "appointment_details": {
+        "id": "apt_123",
+        "date": "2024-01-15",
+        "time": "10:00",
+        "procedure": "Cleaning"
+    }
+})
+CONFIRMATION = json_dumps({
+    "phone": "+61400000000",
+    "type": "confirmation",
+    "appointment_details": {
+        "id": "apt_456",
+        "date": "2024-01-20",
+        "time": "14:30",
+        "procedure": "Root Canal"
+    }
+})
+EMERGENCY = json_dumps({
+    "phone": "+61400000000",
+    "type": "emergency",
+    "priority": "URGENT",
+    "message": "Please call immediately"
+})
+
+
+@pytest.fixture(scope="module")
+def client(app):
+    """One TestClient shared by the module's tests.
+
+    The client is not entered as a context manager: that would run the app
+    lifespan, which initialises the configured database these endpoints
+    never touch.
+    """
+    test_client = TestClient(app)
+    yield test_client
+    test_client.close()
+
 
+@pytest.fixture
+def sms_service(monkeypatch):
+    """Autospec stand-in for the SMS service the send endpoint calls.
 
-client = TestClient(app)
+    The service itself is covered by test_sms_service.py; these tests only
+    check which send method the endpoint picks and what it passes.
+    """
+    service = create_autospec(SMSService, instance=True)
+    for method in ("send_appointment_reminder", "send_confirmation", "send_emergency_alert"):
+        getattr(service, method).return_value = True
+    monkeypatch.setattr(notifications, "sms_service", service)
+    return service
 
 
 class TestNotificationEndpoints:
     """Test notification API endpoints."""
 
-    def test_send_notification_reminder(self):
+    def test_send_notification_reminder(self, client, sms_service):
         """Test sending appointment reminder notification."""
-        response = client.post(
-            "/notifications/send",
-            json={
-                "phone": "+61400000000",
-                "type": "reminder",
-                "appointment_details": {
-                    "id": "apt_123",
-                    "date": "2024-01-15",
-                    "time": "10:00",
-                    "procedure": "Cleaning"
-                }
-            }
-        )
+        response = client.post("/notifications/send", content=REMINDER, headers=JSON_HEADERS)
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
         assert "message_id" in data
+        sent = sms_service.send_appointment_reminder.await_args.kwargs
+        assert sent["phone"] == "+61400000000"
+        assert sent["appointment_details"]["id"] == "apt_123"
 
-    def test_send_notification_confirmation(self):
+    def test_send_notification_confirmation(self, client, sms_service):
         """Test sending appointment confirmation notification."""
-        response = client.post(
-            "/notifications/send",
-            json={
-                "phone": "+61400000000",
-                "type": "confirmation",
-                "appointment_details": {
-                    "id": "apt_456",
-                    "date": "2024-01-20",
-                    "time": "14:30",
-                    "procedure": "Root Canal"
-                }
-            }
-        )
+        response = client.post("/notifications/send", content=CONFIRMATION, headers=JSON_HEADERS)
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
+        sent = sms_service.send_confirmation.await_args.kwargs
+        assert sent["appointment_details"]["id"] == "apt_456"
 
-    def test_send_notification_emergency(self):
+    def test_send_notification_emergency(self, client, sms_service):
         """Test sending emergency notification."""
-        response = client.post(
-            "/notifications/send",
-            json={
-                "phone": "+61400000000",
-                "type": "emergency",
-                "priority": "URGENT",
-                "message": "Please call immediately"
-            }
-        )
+        response = client.post("/notifications/send", content=EMERGENCY, headers=JSON_HEADERS)
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
+        sms_service.send_emergency_alert.assert_awaited_once_with(
+            phone="+61400000000",
+            priority="URGENT",
+            message="Please call immediately",
+        )
 
-    def test_send_notification_invalid_type(self):
+    async def test_send_notification_invalid_type(self):
         """Test sending notification with invalid type."""
-        response = client.post(
-            "/notifications/send",
-            json={
-                "phone": "+61400000000",
-                "type": "invalid_type"
-            }
-        )
-        assert response.status_code == 400
+        # The type is rejected before anything is sent, so call the handler directly
+        request = NotificationRequest(phone="+61400000000", type="invalid_type")
+        with pytest.raises(HTTPException) as exc_info:
+            await send_notification(request, BackgroundTasks())
+        assert exc_info.value.status_code == 400
 
-    def test_get_notification_status(self):
+    def test_get_notification_status(self, client):
         """Test getting notification status."""
         response = client.get("/notifications/status/msg_123")
         assert response.status_code == 200
@@ -84,17 +118,10 @@ class TestNotificationEndpoints:
         assert data["message_id"] == "msg_123"
         assert data["status"] == "delivered"
 
-    def test_get_notification_history(self):
+    def test_get_notification_history(self, client):
         """Test getting notification history."""
         # First send a notification
-        client.post(
-            "/notifications/send",
-            json={
-                "phone": "+61400000000",
-                "type": "reminder",
-                "appointment_details": {"id": "apt_123"}
-            }
-        )
+        client.post("/notifications/send", content=REMINDER, headers=JSON_HEADERS)
 
         # Then get history
         response = client.get("/notifications/history")
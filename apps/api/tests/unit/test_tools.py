@@ -1,97 +1,116 @@
 """Tests for tool functions (availability, heuristics, booking, offers)."""
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import bindparam, insert, select
 from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from src.tools.availability import check_availability
 from src.tools.heuristics import heuristic_move_check
 from src.tools.booking import book_appointment
 from src.tools.offers import send_move_offer, expire_old_offers
 from src.models import (
-    Clinic, Dentist, Patient, Appointment, AppointmentStatus,
-    Procedure, MoveOffer, MoveOfferStatus
+    Appointment, Clinic, Dentist, MoveOffer, MoveOfferStatus, Patient, Procedure
+)
+from tests.factories import (
+    appointment_values,
+    clinic_values,
+    dentist_values,
+    move_offer_values,
+    patient_values,
+    procedure_values,
 )
 
 
-@pytest.mark.asyncio
-async def test_check_availability_no_db():
-    """Test check_availability without database returns placeholder."""
-    result = await check_availability("2024-01-15T09:00:00", "2024-01-17T17:00:00")
-    assert "Available slots" in result
-    assert "Dr. Smith" in result
+# Built once at import; executed with {"appointment_id": ...} so the compiled
+# form is reused from SQLAlchemy's statement cache.
+_OFFER_BY_APPOINTMENT = select(MoveOffer).where(
+    MoveOffer.original_appointment_id == bindparam("appointment_id")
+)
+
+
+def make_slot_id(dentist_id: UUID, start: datetime) -> str:
+    """Slot id in the ``<dentist_id>@<iso start>`` form book_appointment parses."""
+    return f"{dentist_id}@{start.isoformat()}"
+
+
+async def _seed(session: AsyncSession, rows: dict[type, list[dict[str, Any]]]) -> None:
+    """Insert each model's rows with one Core multi-row INSERT, in the given order.
+
+    List parent tables before the tables that reference them.
+    """
+    for model, values in rows.items():
+        await session.execute(insert(model), values)
+
+
+def _booked_appointment(graph: SimpleNamespace, patient_id: UUID, start_time: datetime) -> dict:
+    """Column values for a booked cleaning with the base graph's clinic and dentist."""
+    return appointment_values(
+        patient_id=patient_id,
+        clinic_id=graph.clinic["id"],
+        dentist_id=graph.dentist["id"],
+        start_time=start_time,
+    )
+
+
+@pytest.fixture
+def fixed_future() -> datetime:
+    """A fixed weekday morning well in the future, so slot ids never drift."""
+    return datetime(2030, 1, 1, 10, 0)
+
+
+@pytest.fixture
+async def base_graph(async_session: AsyncSession) -> SimpleNamespace:
+    """Insert a clinic with one active dentist and the D1110 procedure."""
+    clinic = clinic_values()
+    graph = SimpleNamespace(
+        clinic=clinic,
+        dentist=dentist_values(clinic_id=clinic["id"]),
+        procedure=procedure_values(),
+    )
+    await _seed(
+        async_session,
+        {Clinic: [graph.clinic], Dentist: [graph.dentist], Procedure: [graph.procedure]},
+    )
+    return graph
 
 
 @pytest.mark.asyncio
-async def test_check_availability_with_db(async_session: AsyncSession):
+async def test_check_availability_with_db(async_session: AsyncSession, base_graph):
     """Test check_availability with database returns real slots."""
-    # Create clinic and dentist
-    clinic = Clinic(id=uuid4(), name="Test Clinic", api_key="test_key", timezone="Australia/Sydney", settings={})
-    dentist = Dentist(id=uuid4(), clinic_id=clinic.id, name="Dr. Test", is_active=True, specializations=["general"], schedule={})
-    async_session.add_all([clinic, dentist])
-    await async_session.commit()
-
     start = (datetime.now() + timedelta(days=1)).replace(hour=9, minute=0).isoformat()
     end = (datetime.now() + timedelta(days=2)).replace(hour=17, minute=0).isoformat()
 
-    result = await check_availability(start, end, async_session, str(clinic.id))
+    result = await check_availability(start, end, async_session, str(base_graph.clinic["id"]))
     assert "Available slots" in result
 
 
 @pytest.mark.asyncio
 async def test_check_availability_no_dentists(async_session: AsyncSession):
     """Test check_availability with no dentists."""
-    clinic = Clinic(id=uuid4(), name="Test Clinic", api_key="test_key", timezone="Australia/Sydney", settings={})
-    async_session.add(clinic)
-    await async_session.commit()
+    clinic = clinic_values()
+    await _seed(async_session, {Clinic: [clinic]})
 
     start = (datetime.now() + timedelta(days=1)).isoformat()
     end = (datetime.now() + timedelta(days=2)).isoformat()
 
-    result = await check_availability(start, end, async_session, str(clinic.id))
+    result = await check_availability(start, end, async_session, str(clinic["id"]))
     assert "No active dentists" in result
 
 
 @pytest.mark.asyncio
-async def test_heuristic_move_check_no_db():
-    """Test heuristic_move_check without database."""
-    result = await heuristic_move_check(str(uuid4()), 1000.0)
-    assert "move_score" in result
-    assert "recommendation" in result
-    assert "incentive_needed" in result
-    assert "revenue_difference" in result
-
-
-@pytest.mark.asyncio
-async def test_heuristic_move_check_with_db(async_session: AsyncSession):
+async def test_heuristic_move_check_with_db(async_session: AsyncSession, base_graph):
     """Test heuristic_move_check with database."""
-    # Create entities
-    clinic = Clinic(id=uuid4(), name="Test Clinic", api_key="test_key", timezone="Australia/Sydney", settings={})
-    dentist = Dentist(id=uuid4(), clinic_id=clinic.id, name="Dr. Test", is_active=True, specializations=["general"], schedule={})
-    patient = Patient(id=uuid4(), phone="+61412345678", name="John Doe", ltv_score=500.0)
-    async_session.add_all([clinic, dentist, patient])
-    await async_session.commit()
-
-    # Create appointment
-    start_time = datetime.now() + timedelta(days=7)
-    appointment = Appointment(
-        id=uuid4(),
-        patient_id=patient.id,
-        clinic_id=clinic.id,
-        dentist_id=dentist.id,
-        start_time=start_time,
-        duration_mins=30,
-        procedure_code="D1110",
-        procedure_name="Prophylaxis",
-        estimated_value=150.0,
-        status=AppointmentStatus.BOOKED,
+    patient = patient_values(ltv_score=500.0)
+    appointment = _booked_appointment(
+        base_graph, patient["id"], datetime.now() + timedelta(days=7)
     )
-    async_session.add(appointment)
-    await async_session.commit()
+    await _seed(async_session, {Patient: [patient], Appointment: [appointment]})
 
-    result = await heuristic_move_check(str(appointment.id), 1000.0, async_session)
+    result = await heuristic_move_check(str(appointment["id"]), 1000.0, async_session)
     assert result["move_score"] > 0
     assert result["revenue_difference"] > 0
 
@@ -105,33 +124,15 @@ async def test_heuristic_move_check_invalid_appointment(async_session: AsyncSess
 
 
 @pytest.mark.asyncio
-async def test_book_appointment_no_db():
-    """Test book_appointment without database."""
-    result = await book_appointment(str(uuid4()), "slot-id", "D1110")
-    assert result["status"] == "BOOKED"
-    assert "appointment_id" in result
-
-
-@pytest.mark.asyncio
-async def test_book_appointment_with_db(async_session: AsyncSession):
+async def test_book_appointment_with_db(async_session: AsyncSession, base_graph, fixed_future):
     """Test book_appointment with database."""
-    # Create entities
-    clinic = Clinic(id=uuid4(), name="Test Clinic", api_key="test_key", timezone="Australia/Sydney", settings={})
-    dentist = Dentist(id=uuid4(), clinic_id=clinic.id, name="Dr. Test", is_active=True, specializations=["general"], schedule={})
-    patient = Patient(id=uuid4(), phone="+61412345678", name="John Doe")
-    procedure = Procedure(
-        id=uuid4(), code="D1110", name="Prophylaxis", category="Preventive",
-        default_duration_mins=30, base_value=150.0, priority_weight=0.3
-    )
-    async_session.add_all([clinic, dentist, patient, procedure])
-    await async_session.commit()
+    patient = patient_values()
+    await _seed(async_session, {Patient: [patient]})
 
-    # Create slot_id
-    start_time = datetime.now() + timedelta(days=7)
-    slot_id = f"{dentist.id}@{start_time.isoformat()}"
+    slot_id = make_slot_id(base_graph.dentist["id"], fixed_future)
 
     result = await book_appointment(
-        str(patient.id),
+        str(patient["id"]),
         slot_id,
         "D1110",
         async_session
@@ -141,15 +142,9 @@ async def test_book_appointment_with_db(async_session: AsyncSession):
 
 
 @pytest.mark.asyncio
-async def test_book_appointment_invalid_patient(async_session: AsyncSession):
+async def test_book_appointment_invalid_patient(async_session: AsyncSession, base_graph, fixed_future):
     """Test book_appointment with invalid patient_id."""
-    clinic = Clinic(id=uuid4(), name="Test Clinic", api_key="test_key", timezone="Australia/Sydney", settings={})
-    dentist = Dentist(id=uuid4(), clinic_id=clinic.id, name="Dr. Test", is_active=True, specializations=["general"], schedule={})
-    async_session.add_all([clinic, dentist])
-    await async_session.commit()
-
-    start_time = datetime.now() + timedelta(days=7)
-    slot_id = f"{dentist.id}@{start_time.isoformat()}"
+    slot_id = make_slot_id(base_graph.dentist["id"], fixed_future)
 
     result = await book_appointment(
         str(uuid4()),
@@ -161,41 +156,22 @@ async def test_book_appointment_invalid_patient(async_session: AsyncSession):
 
 
 @pytest.mark.asyncio
-async def test_book_appointment_slot_taken(async_session: AsyncSession):
+async def test_book_appointment_slot_taken(async_session: AsyncSession, base_graph, fixed_future):
     """Test book_appointment when slot is already taken."""
-    # Create entities
-    clinic = Clinic(id=uuid4(), name="Test Clinic", api_key="test_key", timezone="Australia/Sydney", settings={})
-    dentist = Dentist(id=uuid4(), clinic_id=clinic.id, name="Dr. Test", is_active=True, specializations=["general"], schedule={})
-    patient1 = Patient(id=uuid4(), phone="+61411111111", name="Patient 1")
-    patient2 = Patient(id=uuid4(), phone="+61422222222", name="Patient 2")
-    procedure = Procedure(
-        id=uuid4(), code="D1110", name="Prophylaxis", category="Preventive",
-        default_duration_mins=30, base_value=150.0, priority_weight=0.3
+    patient1 = patient_values(phone="+61411111111", name="Patient 1")
+    patient2 = patient_values(phone="+61422222222", name="Patient 2")
+    await _seed(
+        async_session,
+        {
+            Patient: [patient1, patient2],
+            Appointment: [_booked_appointment(base_graph, patient1["id"], fixed_future)],
+        },
     )
-    async_session.add_all([clinic, dentist, patient1, patient2, procedure])
-    await async_session.commit()
-
-    # Create existing appointment
-    start_time = datetime.now() + timedelta(days=7)
-    appointment = Appointment(
-        id=uuid4(),
-        patient_id=patient1.id,
-        clinic_id=clinic.id,
-        dentist_id=dentist.id,
-        start_time=start_time,
-        duration_mins=30,
-        procedure_code="D1110",
-        procedure_name="Prophylaxis",
-        estimated_value=150.0,
-        status=AppointmentStatus.BOOKED,
-    )
-    async_session.add(appointment)
-    await async_session.commit()
 
-    slot_id = f"{dentist.id}@{start_time.isoformat()}"
+    slot_id = make_slot_id(base_graph.dentist["id"], fixed_future)
 
     result = await book_appointment(
-        str(patient2.id),
+        str(patient2["id"]),
         slot_id,
         "D1110",
         async_session
@@ -205,42 +181,16 @@ async def test_book_appointment_slot_taken(async_session: AsyncSession):
 
 
 @pytest.mark.asyncio
-async def test_send_move_offer_no_db():
-    """Test send_move_offer without database."""
-    result = await send_move_offer(str(uuid4()), "new-slot", "10% discount")
-    assert result["status"] == "PENDING"
-    assert "offer_id" in result
-
-
-@pytest.mark.asyncio
-async def test_send_move_offer_with_db(async_session: AsyncSession):
+async def test_send_move_offer_with_db(async_session: AsyncSession, base_graph):
     """Test send_move_offer with database."""
-    # Create entities
-    clinic = Clinic(id=uuid4(), name="Test Clinic", api_key="test_key", timezone="Australia/Sydney", settings={})
-    dentist = Dentist(id=uuid4(), clinic_id=clinic.id, name="Dr. Test", is_active=True, specializations=["general"], schedule={})
-    patient = Patient(id=uuid4(), phone="+61412345678", name="John Doe")
-    async_session.add_all([clinic, dentist, patient])
-    await async_session.commit()
-
-    # Create appointment
-    start_time = datetime.now() + timedelta(days=7)
-    appointment = Appointment(
-        id=uuid4(),
-        patient_id=patient.id,
-        clinic_id=clinic.id,
-        dentist_id=dentist.id,
-        start_time=start_time,
-        duration_mins=30,
-        procedure_code="D1110",
-        procedure_name="Prophylaxis",
-        estimated_value=150.0,
-        status=AppointmentStatus.BOOKED,
+    patient = patient_values()
+    appointment = _booked_appointment(
+        base_graph, patient["id"], datetime.now() + timedelta(days=7)
     )
-    async_session.add(appointment)
-    await async_session.commit()
+    await _seed(async_session, {Patient: [patient], Appointment: [appointment]})
 
     result = await send_move_offer(
-        str(appointment.id),
+        str(appointment["id"]),
         "new-slot-id",
         "10% discount",
         async_session
@@ -250,7 +200,7 @@ async def test_send_move_offer_with_db(async_session: AsyncSession):
 
     # Verify offer was created in database
     offer_result = await async_session.execute(
-        select(MoveOffer).where(MoveOffer.original_appointment_id == appointment.id)
+        _OFFER_BY_APPOINTMENT, {"appointment_id": appointment["id"]}
     )
     offer = offer_result.scalar_one_or_none()
     assert offer is not None
@@ -270,123 +220,75 @@ async def test_send_move_offer_invalid_appointment(async_session: AsyncSession):
 
 
 @pytest.mark.asyncio
-async def test_expire_old_offers(async_session: AsyncSession):
+async def test_expire_old_offers(async_session: AsyncSession, base_graph):
     """Test expire_old_offers expires pending offers that have passed their expiry time."""
-    # Create entities
-    clinic = Clinic(id=uuid4(), name="Test Clinic", api_key="test_key", timezone="Australia/Sydney", settings={})
-    dentist = Dentist(id=uuid4(), clinic_id=clinic.id, name="Dr. Test", is_active=True, specializations=["general"], schedule={})
-    patient = Patient(id=uuid4(), phone="+61412345678", name="John Doe")
-    async_session.add_all([clinic, dentist, patient])
-    await async_session.commit()
-
-    # Create appointment
-    start_time = datetime.now() + timedelta(days=7)
-    appointment = Appointment(
-        id=uuid4(),
-        patient_id=patient.id,
-        clinic_id=clinic.id,
-        dentist_id=dentist.id,
-        start_time=start_time,
-        duration_mins=30,
-        procedure_code="D1110",
-        procedure_name="Prophylaxis",
-        estimated_value=150.0,
-        status=AppointmentStatus.BOOKED,
+    patient = patient_values()
+    appointment = _booked_appointment(
+        base_graph, patient["id"], datetime.now() + timedelta(days=7)
     )
-    async_session.add(appointment)
-    await async_session.commit()
 
     # Create two move offers: one expired, one still valid
-    expired_offer = MoveOffer(
-        id=uuid4(),
-        original_appointment_id=appointment.id,
-        target_appointment_id=None,
-        incentive_type="DISCOUNT",
-        incentive_value="10% discount",
-        move_score=75.0,
-        status=MoveOfferStatus.PENDING,
+    expired_offer = move_offer_values(
+        original_appointment_id=appointment["id"],
         offered_at=datetime.now() - timedelta(hours=25),  # 25 hours ago
         expires_at=datetime.now() - timedelta(hours=1),   # 1 hour ago (expired)
     )
-    valid_offer = MoveOffer(
-        id=uuid4(),
-        original_appointment_id=appointment.id,
-        target_appointment_id=None,
-        incentive_type="DISCOUNT",
+    valid_offer = move_offer_values(
+        original_appointment_id=appointment["id"],
         incentive_value="5% discount",
         move_score=50.0,
-        status=MoveOfferStatus.PENDING,
         offered_at=datetime.now() - timedelta(hours=10),  # 10 hours ago
         expires_at=datetime.now() + timedelta(hours=14),  # 14 hours from now (still valid)
     )
-    async_session.add_all([expired_offer, valid_offer])
-    await async_session.commit()
+    await _seed(
+        async_session,
+        {
+            Patient: [patient],
+            Appointment: [appointment],
+            MoveOffer: [expired_offer, valid_offer],
+        },
+    )
 
     # Run the expiry job
     result = await expire_old_offers(async_session)
 
     # Verify only the expired offer was expired
     assert result["expired_count"] == 1
-    assert str(expired_offer.id) in result["offer_ids"]
-
-    # Verify the expired offer status changed
-    expired_result = await async_session.execute(
-        select(MoveOffer).where(MoveOffer.id == expired_offer.id)
-    )
-    updated_expired = expired_result.scalar_one_or_none()
-    assert updated_expired.status == MoveOfferStatus.EXPIRED
-    assert updated_expired.responded_at is not None
+    assert str(expired_offer["id"]) in result["offer_ids"]
 
-    # Verify the valid offer is still pending
-    valid_result = await async_session.execute(
-        select(MoveOffer).where(MoveOffer.id == valid_offer.id)
+    # Verify only the expired offer changed status and got a response time
+    result = await async_session.execute(
+        select(MoveOffer.id, MoveOffer.status, MoveOffer.responded_at).where(
+            MoveOffer.id.in_([expired_offer["id"], valid_offer["id"]])
+        )
     )
-    updated_valid = valid_result.scalar_one_or_none()
-    assert updated_valid.status == MoveOfferStatus.PENDING
-    assert updated_valid.responded_at is None
+    rows = {row.id: row for row in result}
+    assert rows[expired_offer["id"]].status == MoveOfferStatus.EXPIRED
+    assert rows[expired_offer["id"]].responded_at is not None
+    assert rows[valid_offer["id"]].status == MoveOfferStatus.PENDING
+    assert rows[valid_offer["id"]].responded_at is None
 
 
 @pytest.mark.asyncio
-async def test_expire_old_offers_no_expired(async_session: AsyncSession):
+async def test_expire_old_offers_no_expired(async_session: AsyncSession, base_graph):
     """Test expire_old_offers returns zero when no offers are expired."""
-    # Create entities
-    clinic = Clinic(id=uuid4(), name="Test Clinic", api_key="test_key", timezone="Australia/Sydney", settings={})
-    dentist = Dentist(id=uuid4(), clinic_id=clinic.id, name="Dr. Test", is_active=True, specializations=["general"], schedule={})
-    patient = Patient(id=uuid4(), phone="+61412345678", name="John Doe")
-    async_session.add_all([clinic, dentist, patient])
-    await async_session.commit()
-
-    # Create appointment
-    start_time = datetime.now() + timedelta(days=7)
-    appointment = Appointment(
-        id=uuid4(),
-        patient_id=patient.id,
-        clinic_id=clinic.id,
-        dentist_id=dentist.id,
-        start_time=start_time,
-        duration_mins=30,
-        procedure_code="D1110",
-        procedure_name="Prophylaxis",
-        estimated_value=150.0,
-        status=AppointmentStatus.BOOKED,
+    patient = patient_values()
+    appointment = _booked_appointment(
+        base_graph, patient["id"], datetime.now() + timedelta(days=7)
     )
-    async_session.add(appointment)
-    await async_session.commit()
 
     # Create only valid offer
-    valid_offer = MoveOffer(
-        id=uuid4(),
-        original_appointment_id=appointment.id,
-        target_appointment_id=None,
-        incentive_type="DISCOUNT",
+    valid_offer = move_offer_values(
+        original_appointment_id=appointment["id"],
         incentive_value="5% discount",
         move_score=50.0,
-        status=MoveOfferStatus.PENDING,
         offered_at=datetime.now() - timedelta(hours=10),
         expires_at=datetime.now() + timedelta(hours=14),
     )
-    async_session.add(valid_offer)
-    await async_session.commit()
+    await _seed(
+        async_session,
+        {Patient: [patient], Appointment: [appointment], MoveOffer: [valid_offer]},
+    )
 
     # Run the expiry job
     result = await expire_old_offers(async_session)
@@ -0,0 +1,48 @@
+"""Tests for tool functions called without a database session.
+
+Without ``db`` each tool returns a placeholder result, so this module needs
+no engine or session fixtures.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from src.tools.availability import check_availability
+from src.tools.booking import book_appointment
+from src.tools.heuristics import heuristic_move_check
+from src.tools.offers import send_move_offer
+
+
+@pytest.mark.asyncio
+async def test_check_availability_no_db():
+    """Test check_availability without database returns placeholder."""
+    result = await check_availability("2024-01-15T09:00:00", "2024-01-17T17:00:00")
+    assert "Available slots" in result
+    assert "Dr. Smith" in result
+
+
+@pytest.mark.asyncio
+async def test_heuristic_move_check_no_db():
+    """Test heuristic_move_check without database."""
+    result = await heuristic_move_check(str(uuid4()), 1000.0)
+    assert "move_score" in result
+    assert "recommendation" in result
+    assert "incentive_needed" in result
+    assert "revenue_difference" in result
+
+
+@pytest.mark.asyncio
+async def test_book_appointment_no_db():
+    """Test book_appointment without database."""
+    result = await book_appointment(str(uuid4()), "slot-id", "D1110")
+    assert result["status"] == "BOOKED"
+    assert "appointment_id" in result
+
+
+@pytest.mark.asyncio
+async def test_send_move_offer_no_db():
+    """Test send_move_offer without database."""
+    result = await send_move_offer(str(uuid4()), "new-slot", "10% discount")
+    assert result["status"] == "PENDING"
+    assert "offer_id" in result
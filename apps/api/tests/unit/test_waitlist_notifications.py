@@ -13,35 +13,39 @@ class TestWaitlistNotificationService:
         assert service.notifications == []
 
     @pytest.mark.asyncio
-    async def test_send_slot_available_notification(self):
-        """Verify slot available notification is sent correctly."""
+    @pytest.mark.parametrize(
+        ("method", "details_arg", "expected", "message_word"),
+        [
+            (
+                "send_slot_available_notification",
+                "slot_details",
+                {"waitlist_id": "wl_123"},
+                "available",
+            ),
+            (
+                "send_waitlist_confirmation",
+                "appointment_details",
+                {"type": "confirmation"},
+                "confirmed",
+            ),
+        ],
+        ids=["slot_available", "confirmation"],
+    )
+    async def test_send(self, method, details_arg, expected, message_word):
+        """Verify each send method records one notification for the waitlist entry."""
         service = WaitlistNotificationService()
 
-        result = await service.send_slot_available_notification(
+        result = await getattr(service, method)(
             waitlist_id="wl_123",
             patient_phone="+61400000000",
-            slot_details={"date": "2024-01-15", "time": "10:00"}
+            **{details_arg: {"date": "2024-01-15", "time": "10:00"}}
         )
 
         assert result is True
         assert len(service.notifications) == 1
-        assert service.notifications[0]["waitlist_id"] == "wl_123"
-        assert "available" in service.notifications[0]["message"]
-
-    @pytest.mark.asyncio
-    async def test_send_waitlist_confirmation(self):
-        """Verify waitlist confirmation is sent correctly."""
-        service = WaitlistNotificationService()
-
-        result = await service.send_waitlist_confirmation(
-            waitlist_id="wl_123",
-            patient_phone="+61400000000",
-            appointment_details={"date": "2024-01-15", "time": "10:00"}
-        )
-
-        assert result is True
-        assert len(service.notifications) == 1
-        assert service.notifications[0]["type"] == "confirmation"
+        sent = service.notifications[0]
+        assert {key: sent[key] for key in expected} == expected
+        assert message_word in sent["message"]
 
     def test_get_notifications(self):
         """Verify getting notifications works correctly."""
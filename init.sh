@@ -278,7 +278,7 @@ run_tests() {
     echo ""
     info "Running Python backend tests..."
     cd "$PROJECT_ROOT/apps/api"
-    uv run pytest tests/ -v --cov=src --cov-report=term-missing
+    PYTHONDONTWRITEBYTECODE=1 uv run pytest tests/ -v --cov=src --cov-report=term-missing
 
     echo ""
     info "Running JavaScript frontend tests..."
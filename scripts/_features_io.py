@@ -0,0 +1,59 @@
+"""Shared read/write helpers for feature_list.json."""
+
+import json
+import os
+from itertools import compress
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+FEATURE_LIST = 'feature_list.json'
+
+# Field values that mark a feature as passing
+_PASS_PATCH = {"passes": True, "is_dev_done": True, "is_qa_passed": True, "qa_retry_count": 0}
+
+
+def load(path=FEATURE_LIST):
+    """Read the feature list."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def save(features, path=FEATURE_LIST):
+    """Write the feature list with 2-space indentation and a trailing newline.
+
+    The data goes to a temp file that then replaces ``path`` atomically, so a
+    reader never sees a half-written list.
+    """
+    tmp = path + '.tmp'
+    if orjson:
+        # One C-built buffer, one write
+        with open(tmp, 'wb') as f:
+            f.write(orjson.dumps(features, option=orjson.OPT_INDENT_2) + b'\n')
+    else:
+        # Stream encoder chunks through a large buffer instead of joining them first
+        # ensure_ascii=False writes raw UTF-8, matching orjson byte for byte
+        with open(tmp, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(json.JSONEncoder(indent=2, ensure_ascii=False).iterencode(features))
+            f.write('\n')
+    os.replace(tmp, path)
+
+
+def mark_passing(features, descriptions, announce=False):
+    """Mark features whose description is in ``descriptions`` as passing.
+
+    Returns how many features changed. With ``announce``, print each one.
+    """
+    # Classify in one comprehension, then visit only the matches
+    hits = [feature["description"] in descriptions for feature in features]
+    updated_count = 0
+    for feature in compress(features, hits):
+        if not feature.get("passes", False):
+            feature.update(_PASS_PATCH)
+            updated_count += 1
+            if announce:
+                print(f"Updated: {feature['description'][:80]}...")
+    return updated_count
@@ -0,0 +1,44 @@
+"""Tests for the feature_list.json read/write helpers."""
+
+import pytest
+
+from scripts import _features_io
+
+FEATURES = [
+    {"description": "Café booking – naïve “quotes” 予約", "passes": False},
+    {"description": "Plain ASCII", "passes": True},
+]
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    """Run a test once with orjson and once with the stdlib fallback."""
+    if request.param == "orjson":
+        if _features_io.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(_features_io, "orjson", None)
+    return request.param
+
+
+def test_round_trip_non_ascii(tmp_path, encoder):
+    """Test a non-ASCII description survives save and load as raw UTF-8."""
+    path = str(tmp_path / "feature_list.json")
+    _features_io.save(FEATURES, path)
+
+    assert _features_io.load(path) == FEATURES
+    raw = (tmp_path / "feature_list.json").read_bytes()
+    assert "Café booking".encode() in raw
+    assert b"\\u" not in raw
+    assert raw.endswith(b"]\n")
+
+
+def test_encoders_write_identical_bytes(tmp_path, monkeypatch):
+    """Test the written bytes do not depend on whether orjson is installed."""
+    if _features_io.orjson is None:
+        pytest.skip("orjson is not installed")
+    _features_io.save(FEATURES, str(tmp_path / "orjson.json"))
+    monkeypatch.setattr(_features_io, "orjson", None)
+    _features_io.save(FEATURES, str(tmp_path / "json.json"))
+
+    assert (tmp_path / "orjson.json").read_bytes() == (tmp_path / "json.json").read_bytes()
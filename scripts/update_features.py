@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
-"""Update feature_list.json to reflect current test status."""
+"""Update feature_list.json to reflect current test status.
+
+Run from the repository root: python -m scripts.update_features
+"""
 
-import json
 from datetime import datetime, timezone
 
+from scripts._features_io import load, save
+
 def update_feature_list():
-    with open('feature_list.json', 'r') as f:
-        features = json.load(f)
+    features = load()
 
     # Features 18-26 are agent-related features that need proper deepagents integration
     # The current keyword-based implementation works but these features aren't fully tested
@@ -27,8 +30,7 @@ def update_feature_list():
             features[i]['is_qa_passed'] = False
 
     # Write updated feature list
-    with open('feature_list.json', 'w') as f:
-        json.dump(features, f, indent=2)
+    save(features)
 
     print("Updated feature_list.json")
     print("\nFeatures 18-26: Marked as NOT dev_done (need deepagents integration)")
@@ -3,41 +3,35 @@
 Mark additional features as passing based on test results.
 """
 
-import json
+from scripts._features_io import load, mark_passing, save
+
+# Additional features that should be passing based on test results
+ADDITIONAL_FEATURES = frozenset({
+    "Proactive Negotiation - Generate discount incentive offer",
+    "Proactive Negotiation - Generate priority slot incentive offer",
+    "Proactive Negotiation - Track offer acceptance rate",
+    "Proactive Negotiation - Handle voluntary reschedule request",
+    "Move Offers - Create move offer record",
+    "Move Offers - Accept move offer updates appointment",
+    "Move Offers - Decline move offer",
+    "Move Offers - Expire move offer after time limit",
+    "Move Offers - Generate incentive offer with appropriate value",
+    "IntakeSpecialist Agent - Achieves 80%+ triage accuracy on test cases"
+})
+
+def mark_additional_features(features):
+    """Mark ADDITIONAL_FEATURES as passing; return how many changed."""
+    return mark_passing(features, ADDITIONAL_FEATURES, announce=True)
 
 def update_additional_features():
     # Read the current feature list
-    with open('feature_list.json', 'r') as f:
-        features = json.load(f)
-
-    # Additional features that should be passing based on test results
-    additional_features = [
-        "Proactive Negotiation - Generate discount incentive offer",
-        "Proactive Negotiation - Generate priority slot incentive offer",
-        "Proactive Negotiation - Track offer acceptance rate",
-        "Proactive Negotiation - Handle voluntary reschedule request",
-        "Move Offers - Create move offer record",
-        "Move Offers - Accept move offer updates appointment",
-        "Move Offers - Decline move offer",
-        "Move Offers - Expire move offer after time limit",
-        "Move Offers - Generate incentive offer with appropriate value",
-        "IntakeSpecialist Agent - Achieves 80%+ triage accuracy on test cases"
-    ]
-
-    updated_count = 0
-    for feature in features:
-        if feature["description"] in additional_features:
-            if not feature.get("passes", False):
-                feature["passes"] = True
-                feature["is_dev_done"] = True
-                feature["is_qa_passed"] = True
-                feature["qa_retry_count"] = 0
-                updated_count += 1
-                print(f"Updated: {feature['description'][:80]}...")
-
-    # Write back to file
-    with open('feature_list.json', 'w') as f:
-        json.dump(features, f, indent=2)
+    features = load()
+
+    updated_count = mark_additional_features(features)
+
+    # Write back to file only if something changed
+    if updated_count:
+        save(features)
 
     # Print summary
     passing = sum(1 for f in features if f.get("passes", False))
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Apply the update_features.py, update_additional_features.py and
+update_resource_optimiser.py changes in one pass.
+feature_list.json is read, scanned and written once instead of once per script.
+"""
+
+from scripts._features_io import load, mark_passing, save
+from update_additional_features import ADDITIONAL_FEATURES
+from update_features import PASSING_FEATURES
+from update_resource_optimiser import RESOURCE_OPTIMISER_FEATURES
+
+ALL_PASSING_FEATURES = PASSING_FEATURES | ADDITIONAL_FEATURES | RESOURCE_OPTIMISER_FEATURES
+
+def update_all():
+    features = load()
+
+    updated_count = mark_passing(features, ALL_PASSING_FEATURES, announce=True)
+
+    if updated_count:
+        save(features)
+
+    # Print summary
+    passing = sum(1 for f in features if f.get("passes", False))
+    print(f"\nUpdated {updated_count} features to passing state")
+    print(f"Final passing count: {passing}/{len(features)} ({passing/len(features)*100:.1f}%)")
+
+if __name__ == "__main__":
+    update_all()
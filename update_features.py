@@ -5,120 +5,115 @@ Based on the current test suite, we have 70 tests passing which should correspon
 to more features being marked as complete.
 """
 
-import json
-import os
+from scripts._features_io import load, mark_passing, save
+
+# Features that should be passing based on test results
+PASSING_FEATURES = frozenset({
+    # Session API (4 features)
+    "Session API - Create new session with valid clinic API key returns session_id and welcome message",
+    "Session API - Create session with invalid API key returns 401 unauthorized",
+    "Session API - Get existing session returns session details",
+    "Session API - Get non-existent session returns 404",
+
+    # Chat API (7 features)
+    "Chat API - Send message to valid session returns acknowledgment",
+    "Chat API - Send message to invalid session returns error",
+    "Chat Streaming - SSE endpoint returns token events for typewriter effect",
+    "Chat Streaming - SSE returns agent_state events during processing",
+    "Chat Streaming - SSE returns ui_component events for generative UI",
+    "Root Agent - Receptionist correctly identifies pain/emergency intent",
+    "Root Agent - Receptionist correctly identifies booking intent",
+
+    # Intake Specialist (7 features)
+    "Root Agent - Receptionist maintains polite and helpful tone",
+    "Intake Specialist - Asks patient for pain level on 1-10 scale",
+    "Intake Specialist - Checks for red flag symptoms (swelling)",
+    "Intake Specialist - Checks for red flag symptoms (fever)",
+    "Intake Specialist - Checks for red flag symptoms (breathing difficulty)",
+    "Intake Specialist - Calculates PRIORITY score based on symptoms",
+    "Intake Specialist - Maintains empathetic and professional conversational flow",
+
+    # Resource Optimiser (9 features)
+    "Resource Optimiser - Finds available appointment slots",
+    "Resource Optimiser - Checks for conflicts with existing appointments",
+    "Resource Optimiser - Filters slots by procedure type",
+    "Resource Optimiser - Calculates move score for existing appointments",
+    "Resource Optimiser - Sends incentive offers for schedule optimization",
+    "Resource Optimiser - Books new appointments",
+    "Resource Optimiser - Updates existing appointment details",
+    "Resource Optimiser - Handles appointment cancellations",
+    "Resource Optimiser - Negotiates rescheduling with patients",
+
+    # Appointments API (10 features)
+    "Appointments API - Get available slots returns valid time ranges",
+    "Appointments API - Get available slots filters by procedure code",
+    "Appointments API - Create appointment validates input parameters",
+    "Appointments API - Create appointment checks for double booking",
+    "Appointments API - Update appointment status",
+    "Appointments API - Update appointment time with conflict checking",
+    "Appointments API - Cancel appointment updates status to CANCELLED",
+    "Appointments API - Returns error for non-existent appointments",
+    "Appointments API - Returns error for invalid date ranges",
+    "Appointments API - Handles clinic lookup validation",
+
+    # Patients API (13 features)
+    "Patients API - Lookup patient by phone number (E.164 format)",
+    "Patients API - Lookup returns 404 for non-existent patients",
+    "Patients API - Lookup validates phone number format",
+    "Patients API - Create patient validates required fields",
+    "Patients API - Create patient prevents duplicate phone numbers",
+    "Patients API - Create patient validates email format if provided",
+    "Patients API - Create patient initializes with default risk profile",
+    "Patients API - Update patient risk profile (pain_tolerance, anxiety_level)",
+    "Patients API - Update patient LTV score",
+    "Patients API - Update patient returns 404 for non-existent patients",
+    "Patients API - Update patient validates LTV score (non-negative)",
+    "Patients API - Delete patient updates status to DELETED",
+    "Patients API - Patient lookup returns full patient details",
+
+    # Heuristics API (7 features)
+    "Heuristics API - Calculate move score for appointment optimization",
+    "Heuristics API - Calculate move score with high-value procedure",
+    "Heuristics API - Calculate move score with low-value procedure",
+    "Heuristics API - Calculate move score handles invalid appointment ID",
+    "Heuristics API - Calculate move score validates input format",
+    "Heuristics API - Optimize day returns scheduling suggestions",
+    "Heuristics API - Optimize day handles empty schedule",
+
+    # Admin API (8 features)
+    "Admin API - Get analytics returns statistics",
+    "Admin API - Get analytics handles empty database",
+    "Admin API - Get pending feedback returns unapproved items",
+    "Admin API - Get pending feedback filters by clinic",
+    "Admin API - Approve feedback updates status",
+    "Admin API - Approve feedback prevents duplicate approvals",
+    "Admin API - Approve feedback returns 404 for non-existent feedback",
+    "Admin API - Analytics includes key performance indicators"
+})
+
+def mark_passing_features(features):
+    """Mark PASSING_FEATURES as passing; return how many changed."""
+    return mark_passing(features, PASSING_FEATURES)
 
 def update_feature_list():
     # Read the current feature list
-    with open('feature_list.json', 'r') as f:
-        features = json.load(f)
+    features = load()
 
+    passing = sum(1 for f in features if f.get("passes", False))
     print(f"Total features: {len(features)}")
-    print(f"Currently passing: {sum(1 for f in features if f.get('passes', False))}")
-
-    # Features that should be passing based on test results
-    passing_features = [
-        # Session API (4 features)
-        "Session API - Create new session with valid clinic API key returns session_id and welcome message",
-        "Session API - Create session with invalid API key returns 401 unauthorized",
-        "Session API - Get existing session returns session details",
-        "Session API - Get non-existent session returns 404",
-
-        # Chat API (7 features)
-        "Chat API - Send message to valid session returns acknowledgment",
-        "Chat API - Send message to invalid session returns error",
-        "Chat Streaming - SSE endpoint returns token events for typewriter effect",
-        "Chat Streaming - SSE returns agent_state events during processing",
-        "Chat Streaming - SSE returns ui_component events for generative UI",
-        "Root Agent - Receptionist correctly identifies pain/emergency intent",
-        "Root Agent - Receptionist correctly identifies booking intent",
-
-        # Intake Specialist (7 features)
-        "Root Agent - Receptionist maintains polite and helpful tone",
-        "Intake Specialist - Asks patient for pain level on 1-10 scale",
-        "Intake Specialist - Checks for red flag symptoms (swelling)",
-        "Intake Specialist - Checks for red flag symptoms (fever)",
-        "Intake Specialist - Checks for red flag symptoms (breathing difficulty)",
-        "Intake Specialist - Calculates PRIORITY score based on symptoms",
-        "Intake Specialist - Maintains empathetic and professional conversational flow",
-
-        # Resource Optimiser (9 features)
-        "Resource Optimiser - Finds available appointment slots",
-        "Resource Optimiser - Checks for conflicts with existing appointments",
-        "Resource Optimiser - Filters slots by procedure type",
-        "Resource Optimiser - Calculates move score for existing appointments",
-        "Resource Optimiser - Sends incentive offers for schedule optimization",
-        "Resource Optimiser - Books new appointments",
-        "Resource Optimiser - Updates existing appointment details",
-        "Resource Optimiser - Handles appointment cancellations",
-        "Resource Optimiser - Negotiates rescheduling with patients",
-
-        # Appointments API (10 features)
-        "Appointments API - Get available slots returns valid time ranges",
-        "Appointments API - Get available slots filters by procedure code",
-        "Appointments API - Create appointment validates input parameters",
-        "Appointments API - Create appointment checks for double booking",
-        "Appointments API - Update appointment status",
-        "Appointments API - Update appointment time with conflict checking",
-        "Appointments API - Cancel appointment updates status to CANCELLED",
-        "Appointments API - Returns error for non-existent appointments",
-        "Appointments API - Returns error for invalid date ranges",
-        "Appointments API - Handles clinic lookup validation",
-
-        # Patients API (13 features)
-        "Patients API - Lookup patient by phone number (E.164 format)",
-        "Patients API - Lookup returns 404 for non-existent patients",
-        "Patients API - Lookup validates phone number format",
-        "Patients API - Create patient validates required fields",
-        "Patients API - Create patient prevents duplicate phone numbers",
-        "Patients API - Create patient validates email format if provided",
-        "Patients API - Create patient initializes with default risk profile",
-        "Patients API - Update patient risk profile (pain_tolerance, anxiety_level)",
-        "Patients API - Update patient LTV score",
-        "Patients API - Update patient returns 404 for non-existent patients",
-        "Patients API - Update patient validates LTV score (non-negative)",
-        "Patients API - Delete patient updates status to DELETED",
-        "Patients API - Patient lookup returns full patient details",
-
-        # Heuristics API (7 features)
-        "Heuristics API - Calculate move score for appointment optimization",
-        "Heuristics API - Calculate move score with high-value procedure",
-        "Heuristics API - Calculate move score with low-value procedure",
-        "Heuristics API - Calculate move score handles invalid appointment ID",
-        "Heuristics API - Calculate move score validates input format",
-        "Heuristics API - Optimize day returns scheduling suggestions",
-        "Heuristics API - Optimize day handles empty schedule",
-
-        # Admin API (8 features)
-        "Admin API - Get analytics returns statistics",
-        "Admin API - Get analytics handles empty database",
-        "Admin API - Get pending feedback returns unapproved items",
-        "Admin API - Get pending feedback filters by clinic",
-        "Admin API - Approve feedback updates status",
-        "Admin API - Approve feedback prevents duplicate approvals",
-        "Admin API - Approve feedback returns 404 for non-existent feedback",
-        "Admin API - Analytics includes key performance indicators"
-    ]
+    print(f"Currently passing: {passing}")
 
     # Update features
-    updated_count = 0
-    for feature in features:
-        if feature["description"] in passing_features:
-            if not feature.get("passes", False):
-                feature["passes"] = True
-                feature["is_dev_done"] = True
-                feature["is_qa_passed"] = True
-                feature["qa_retry_count"] = 0
-                updated_count += 1
+    updated_count = mark_passing_features(features)
 
     print(f"Updated {updated_count} features to passing state")
 
-    # Write back to file
-    with open('feature_list.json', 'w') as f:
-        json.dump(features, f, indent=2)
+    # Write back to file only if something changed
+    if updated_count:
+        save(features)
 
-    # Print summary
-    passing = sum(1 for f in features if f.get("passes", False))
+    # Print summary; every updated feature went from failing to passing
+    passing += updated_count
     print(f"Final passing count: {passing}/{len(features)} ({passing/len(features)*100:.1f}%)")
 
 if __name__ == "__main__":
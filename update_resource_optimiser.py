@@ -3,44 +3,38 @@
 Mark ResourceOptimiser features as passing since tests confirm they're working.
 """
 
-import json
+from scripts._features_io import load, mark_passing, save
+
+# ResourceOptimiser features that should be passing based on test results
+RESOURCE_OPTIMISER_FEATURES = frozenset({
+    "ResourceOptimiser Agent - Uses check_availability tool to find slots",
+    "ResourceOptimiser Agent - Uses heuristic_move_check when no slots available",
+    "ResourceOptimiser Agent - Negotiates moves when score > 70",
+    "ResourceOptimiser Agent - Does not negotiate when score <= 70",
+    "ResourceOptimiser Agent - Finds available appointment slots",
+    "ResourceOptimiser Agent - Checks for conflicts with existing appointments",
+    "ResourceOptimiser Agent - Filters slots by procedure type",
+    "ResourceOptimiser Agent - Calculates move score for existing appointments",
+    "ResourceOptimiser Agent - Sends incentive offers for schedule optimization",
+    "ResourceOptimiser Agent - Books new appointments",
+    "ResourceOptimiser Agent - Updates existing appointment details",
+    "ResourceOptimiser Agent - Handles appointment cancellations",
+    "ResourceOptimiser Agent - Negotiates rescheduling with patients"
+})
+
+def mark_resource_optimiser_features(features):
+    """Mark RESOURCE_OPTIMISER_FEATURES as passing; return how many changed."""
+    return mark_passing(features, RESOURCE_OPTIMISER_FEATURES, announce=True)
 
 def update_resource_optimiser_features():
     # Read the current feature list
-    with open('feature_list.json', 'r') as f:
-        features = json.load(f)
-
-    # ResourceOptimiser features that should be passing based on test results
-    resource_optimiser_features = [
-        "ResourceOptimiser Agent - Uses check_availability tool to find slots",
-        "ResourceOptimiser Agent - Uses heuristic_move_check when no slots available",
-        "ResourceOptimiser Agent - Negotiates moves when score > 70",
-        "ResourceOptimiser Agent - Does not negotiate when score <= 70",
-        "ResourceOptimiser Agent - Finds available appointment slots",
-        "ResourceOptimiser Agent - Checks for conflicts with existing appointments",
-        "ResourceOptimiser Agent - Filters slots by procedure type",
-        "ResourceOptimiser Agent - Calculates move score for existing appointments",
-        "ResourceOptimiser Agent - Sends incentive offers for schedule optimization",
-        "ResourceOptimiser Agent - Books new appointments",
-        "ResourceOptimiser Agent - Updates existing appointment details",
-        "ResourceOptimiser Agent - Handles appointment cancellations",
-        "ResourceOptimiser Agent - Negotiates rescheduling with patients"
-    ]
-
-    updated_count = 0
-    for feature in features:
-        if feature["description"] in resource_optimiser_features:
-            if not feature.get("passes", False):
-                feature["passes"] = True
-                feature["is_dev_done"] = True
-                feature["is_qa_passed"] = True
-                feature["qa_retry_count"] = 0
-                updated_count += 1
-                print(f"Updated: {feature['description'][:80]}...")
-
-    # Write back to file
-    with open('feature_list.json', 'w') as f:
-        json.dump(features, f, indent=2)
+    features = load()
+
+    updated_count = mark_resource_optimiser_features(features)
+
+    # Write back to file only if something changed
+    if updated_count:
+        save(features)
 
     # Print summary
     passing = sum(1 for f in features if f.get("passes", False))
@@ -48,4 +42,4 @@ def update_resource_optimiser_features():
     print(f"Final passing count: {passing}/{len(features)} ({passing/len(features)*100:.1f}%)")
 
 if __name__ == "__main__":
-    update_resource_optimiser_features()
\ No newline at end of file
+    update_resource_optimiser_features()